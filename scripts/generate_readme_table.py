@@ -7,46 +7,101 @@ Usage:
     python scripts/generate_readme_table.py
 """
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def scan_variable_dir(var_dir: Path):
+    """
+    Count data files and find the first/last date in a variable directory
+
+    Single pass over os.scandir: no Path objects, no sort.
+
+    Args:
+        var_dir: Variable data directory
+
+    Returns:
+        Tuple of (count, min_name, max_name)
+    """
+    count = 0
+    min_name = None
+    max_name = None
+
+    with os.scandir(var_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith('.pckl'):
+                continue
+            count += 1
+            if min_name is None or name < min_name:
+                min_name = name
+            if max_name is None or name > max_name:
+                max_name = name
+
+    return count, min_name, max_name
+
+
+def scan_one(config_file: Path, base_path: Path) -> dict:
+    """
+    Build the overview row for a single chokepoint
+
+    Args:
+        config_file: Path to the chokepoint's state_variables.json
+        base_path: Project root
+
+    Returns:
+        Dictionary describing the chokepoint row
+    """
+    chokepoint = config_file.parent.name
+    with open(config_file, 'rb') as f:
+        raw = f.read()
+    config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Count data files
+    data_dir = base_path / 'data/logistics/chokepoints' / chokepoint
+    total_files = 0
+    date_range = None
+
+    if data_dir.exists():
+        for var in config.keys():
+            var_dir = data_dir / var
+            if var_dir.exists():
+                count, min_name, max_name = scan_variable_dir(var_dir)
+                total_files += count
+
+                # Get date range from filenames
+                if count and not date_range:
+                    first_date = min_name[:-len('.pckl')]
+                    last_date = max_name[:-len('.pckl')]
+                    date_range = f"{first_date} ~ {last_date}"
+
+    return {
+        'name': chokepoint,
+        'variables': ', '.join(config.keys()),
+        'count': total_files,
+        'date_range': date_range or 'N/A',
+        'status': '✅' if total_files > 0 else '⏳'
+    }
 
 
 def generate_data_overview():
     """Generate data overview table for README"""
 
     # Get all chokepoints with configs
-    chokepoints = []
     base_path = Path(__file__).parent.parent
+    configs = sorted((base_path / 'src/logistics/chokepoints').glob('*/state_variables.json'))
 
-    for config_file in sorted((base_path / 'src/logistics/chokepoints').glob('*/state_variables.json')):
-        chokepoint = config_file.parent.name
-        with open(config_file) as f:
-            config = json.load(f)
-
-        # Count data files
-        data_dir = base_path / 'data/logistics/chokepoints' / chokepoint
-        total_files = 0
-        date_range = None
-
-        if data_dir.exists():
-            for var in config.keys():
-                var_dir = data_dir / var
-                if var_dir.exists():
-                    files = sorted(var_dir.glob('*.pckl'))
-                    total_files += len(files)
-
-                    # Get date range from filenames
-                    if files and not date_range:
-                        first_date = files[0].stem
-                        last_date = files[-1].stem
-                        date_range = f"{first_date} ~ {last_date}"
-
-        chokepoints.append({
-            'name': chokepoint,
-            'variables': ', '.join(config.keys()),
-            'count': total_files,
-            'date_range': date_range or 'N/A',
-            'status': '✅' if total_files > 0 else '⏳'
-        })
+    # Scan chokepoints concurrently (directory listing is I/O-bound)
+    chokepoints = []
+    if configs:
+        with ThreadPoolExecutor(max_workers=min(16, len(configs))) as executor:
+            chokepoints = list(executor.map(lambda c: scan_one(c, base_path), configs))
 
     # Generate markdown table
     lines = []
@@ -0,0 +1,131 @@
+"""
+Shared Playwright browser pool
+Keeps a Chromium instance alive across collections instead of launching one per page
+"""
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from playwright.sync_api import sync_playwright
+
+
+# Relaunch the browser after this many contexts to bound memory growth
+MAX_CONTEXTS_PER_BROWSER = 100
+
+LAUNCH_ARGS = ['--disable-dev-shm-usage']
+
+# Playwright's sync API is bound to the thread that started it (it can't
+# even be closed from another one), so the browser lives on a single
+# daemon thread and callers from any thread hand it work through _tasks
+_tasks: 'queue.Queue' = queue.Queue()
+_thread = None
+_thread_lock = threading.Lock()
+
+# Playwright/browser state, only touched on the browser thread
+_state = None
+
+
+def _browser_thread():
+    """Run submitted work, one task at a time, on the browser thread"""
+    while True:
+        fn, future = _tasks.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _submit(fn: Callable[[], Any]) -> Future:
+    """
+    Queue a function to run on the browser thread, starting it on first use
+
+    Args:
+        fn: Function to run
+
+    Returns:
+        Future of the function's result
+    """
+    global _thread
+
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_browser_thread, name='playwright-browser', daemon=True)
+            _thread.start()
+
+    future = Future()
+    _tasks.put((fn, future))
+    return future
+
+
+def _get_browser():
+    """
+    Get the shared browser, launching it on first use (browser thread only)
+
+    Returns:
+        Playwright Browser instance
+    """
+    global _state
+
+    if _state is not None:
+        if _state['uses'] >= MAX_CONTEXTS_PER_BROWSER or not _state['browser'].is_connected():
+            _close_browser()
+
+    if _state is None:
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        _state = {'playwright': playwright, 'browser': browser, 'uses': 0}
+
+    _state['uses'] += 1
+    return _state['browser']
+
+
+def _close_browser():
+    """Close the browser and stop Playwright (browser thread only)"""
+    global _state
+
+    state, _state = _state, None
+    if state is None:
+        return
+
+    try:
+        state['browser'].close()
+    except Exception:
+        pass
+
+    try:
+        state['playwright'].stop()
+    except Exception:
+        pass
+
+
+def run_with_browser(fn: Callable[[Any], Any]) -> Any:
+    """
+    Run a function with the shared browser, from any thread
+
+    Calls are serialized on the browser thread.
+
+    Args:
+        fn: Function taking the Playwright Browser
+
+    Returns:
+        The function's result (its exceptions are re-raised in the caller)
+    """
+    return _submit(lambda: fn(_get_browser())).result()
+
+
+def close_browser():
+    """
+    Close the shared browser and stop Playwright (relaunched on next use)
+    """
+    if _thread is None:
+        return
+
+    _submit(_close_browser).result()
+
+
+atexit.register(close_browser)
@@ -2,10 +2,46 @@
 IMF PortWatch Collector
 Fetches chokepoint vessel arrival data from IMF PortWatch
 """
-from datetime import datetime
-from typing import Dict, Any, List
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-import requests
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, List
+import ijson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _row(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an ArcGIS feature's attributes into a daily time series record
+
+    Args:
+        attrs: Feature attributes from the Daily_Chokepoints_Data layer
+
+    Returns:
+        Daily record dictionary
+    """
+    return {
+        'date': datetime.fromtimestamp(attrs['date'] / 1000).strftime('%Y-%m-%d'),
+        'year': attrs.get('year'),
+        'month': attrs.get('month'),
+        'day': attrs.get('day'),
+        'vessel_count': attrs.get('n_total', 0),
+        'container': attrs.get('n_container', 0),
+        'dry_bulk': attrs.get('n_dry_bulk', 0),
+        'general_cargo': attrs.get('n_general_cargo', 0),
+        'roro': attrs.get('n_roro', 0),
+        'tanker': attrs.get('n_tanker', 0)
+    }
 
 
 class IMFPortWatchCollector:
@@ -21,15 +57,33 @@ class IMFPortWatchCollector:
         'bosporus-strait': 'chokepoint3'
     }
 
-    def __init__(self):
-        pass
+    # Discovered ArcGIS query URLs are reused for this long before re-extracting
+    URL_CACHE_TTL = timedelta(days=7)
+
+    # HTTP session shared by all instances so connections (and TLS) are reused
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, cache_path: Path = None):
+        """
+        Initialize collector
+
+        Args:
+            cache_path: Path to the API URL cache (defaults to data/_cache/arcgis_urls.json)
+        """
+        if cache_path is None:
+            cache_path = Path(__file__).parent.parent.parent / 'data' / '_cache' / 'arcgis_urls.json'
+
+        self.cache_path = Path(cache_path)
+        self._cache_lock = threading.Lock()
+        self._url_cache = self._load_url_cache()
 
     def collect(self, source_url: str, chokepoint: str, variable: str, start_date: str = None) -> Dict[str, Any]:
         """
         Collect vessel arrival historical data from IMF PortWatch
 
-        This method extracts the ArcGIS API URL from the page and fetches
-        daily vessel data for the chokepoint. Can optionally fetch only data
+        This method extracts the ArcGIS API URL from the page (or reuses a
+        cached one) and fetches daily vessel data for the chokepoint. Can optionally fetch only data
         from a specific start date onwards (incremental collection).
 
         Args:
@@ -49,44 +103,45 @@ class IMFPortWatchCollector:
 
             if start_date:
                 print(f"   📡 Fetching data from {start_date} onwards...")
-            else:
-                print(f"   📡 Extracting API URL from {source_url}...")
-
-            # Use Playwright to load the page and capture the query URL
-            query_url = self._extract_api_url(source_url, portid)
 
-            if not query_url:
-                raise Exception("Could not extract API URL from page")
+            # Reuse the query URL from a previous run if it's still fresh
+            query_url = self._get_cached_url(portid)
+            from_cache = query_url is not None
 
-            print(f"   🎯 Found API URL")
-
-            # Convert protobuf URL to JSON and add ordering
-            json_url = query_url.replace('f=pbf', 'f=json')
-
-            # Add orderByFields to get newest data first
-            if 'orderByFields' not in json_url:
-                json_url += '&orderByFields=date%20DESC'
+            if from_cache:
+                print(f"   🎯 Using cached API URL")
+            else:
+                query_url = self._discover_api_url(source_url, portid)
 
             # If start_date is provided, we'll fetch recent data and filter in Python
             # (ArcGIS API doesn't support date comparison in where clause)
+            start_epoch = None
             if start_date:
                 from datetime import datetime as dt
                 start_dt = dt.strptime(start_date, '%Y-%m-%d')
                 start_epoch = int(start_dt.timestamp() * 1000)
-
-                # Fetch last 100 days to ensure we get all new data
-                json_url += '&resultRecordCount=100'
                 print(f"   📥 Fetching recent data (will filter >= {start_date})...")
             else:
                 print(f"   📥 Fetching all historical data...")
 
             # Fetch the data
-            response = requests.get(json_url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            try:
+                time_series, feature_count = self._fetch_time_series(
+                    self._build_json_url(query_url, start_date), start_epoch
+                )
+            except Exception as e:
+                if not from_cache:
+                    raise
+
+                # Cached URL went stale, rediscover it from the page
+                print(f"   ⚠️ Cached API URL failed ({e}), re-extracting...")
+                query_url = self._discover_api_url(source_url, portid)
+                time_series, feature_count = self._fetch_time_series(
+                    self._build_json_url(query_url, start_date), start_epoch
+                )
 
             # Check if we got any features
-            if 'features' not in data or not data['features']:
+            if not feature_count:
                 # This is normal when doing incremental collection and there's no new data
                 print(f"   ℹ️ No new data available from API")
                 return {
@@ -104,33 +159,11 @@ class IMFPortWatchCollector:
                     "note": "No new data available"
                 }
 
-            # Process the features into time series
-            time_series = []
-            for feature in data['features']:
-                attrs = feature['attributes']
-                date_ms = attrs.get('date')
-
-                if date_ms:
-                    # Filter by start_date if provided
-                    if start_date and date_ms < start_epoch:
-                        continue
-
-                    dt = datetime.fromtimestamp(date_ms / 1000)
-                    time_series.append({
-                        'date': dt.strftime('%Y-%m-%d'),
-                        'year': attrs.get('year'),
-                        'month': attrs.get('month'),
-                        'day': attrs.get('day'),
-                        'vessel_count': attrs.get('n_total', 0),
-                        'container': attrs.get('n_container', 0),
-                        'dry_bulk': attrs.get('n_dry_bulk', 0),
-                        'general_cargo': attrs.get('n_general_cargo', 0),
-                        'roro': attrs.get('n_roro', 0),
-                        'tanker': attrs.get('n_tanker', 0)
-                    })
-
-            # Sort by date
-            time_series.sort(key=lambda x: x['date'])
+            # API returns newest first (orderByFields=date DESC), so reversing sorts by date
+            time_series.reverse()
+            if any(a['date'] > b['date'] for a, b in zip(time_series, time_series[1:])):
+                # Captured URL had its own ordering
+                time_series.sort(key=lambda x: x['date'])
 
             if time_series:
                 print(f"   ✅ Collected {len(time_series)} daily records")
@@ -163,9 +196,98 @@ class IMFPortWatchCollector:
                 "error": str(e)
             }
 
-    def _extract_api_url(self, source_url: str, portid: str) -> str:
+    def _build_json_url(self, query_url: str, start_date: str = None) -> str:
         """
-        Extract the ArcGIS API query URL from the page by intercepting network requests
+        Build the JSON data URL from a captured ArcGIS query URL
+
+        Args:
+            query_url: The captured API query URL
+            start_date: Optional start date; limits the query to recent records
+
+        Returns:
+            URL returning JSON features ordered newest first
+        """
+        # Convert protobuf URL to JSON and add ordering
+        json_url = query_url.replace('f=pbf', 'f=json')
+
+        # Add orderByFields to get newest data first
+        if 'orderByFields' not in json_url:
+            json_url += '&orderByFields=date%20DESC'
+
+        if start_date:
+            # Fetch last 100 days to ensure we get all new data
+            json_url += '&resultRecordCount=100'
+
+        return json_url
+
+    def _fetch_time_series(self, json_url: str, start_epoch: int = None):
+        """
+        Stream an ArcGIS JSON response and convert features to daily records
+
+        Features are parsed as they arrive instead of buffering the whole
+        response before processing.
+
+        Args:
+            json_url: URL to fetch
+            start_epoch: Optional epoch milliseconds; earlier records are dropped
+
+        Returns:
+            Tuple of (time_series, number of features in the response)
+        """
+        attrs_prefix = 'features.item.attributes'
+        time_series = []
+        feature_count = 0
+        builder = None
+
+        with self._get_session().get(json_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                # ArcGIS reports query errors with a 200 status and an error body
+                if prefix == 'error' and event == 'start_map':
+                    raise Exception("ArcGIS returned an error response")
+
+                if prefix == attrs_prefix and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+
+                if builder is None:
+                    continue
+
+                builder.event(event, value)
+
+                if prefix == attrs_prefix and event == 'end_map':
+                    attrs = builder.value
+                    builder = None
+                    feature_count += 1
+
+                    date_ms = attrs.get('date')
+                    if date_ms and (start_epoch is None or date_ms >= start_epoch):
+                        time_series.append(_row(attrs))
+
+        return time_series, feature_count
+
+    @classmethod
+    def _get_session(cls) -> 'requests.Session':
+        """
+        Get the shared HTTP session, creating it on first use
+
+        Returns:
+            requests Session with a pooled keep-alive connection adapter
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                import requests
+
+                session = requests.Session()
+                session.headers.update({'Accept': 'application/json'})
+                cls._session = session
+
+            return cls._session
+
+    def _discover_api_url(self, source_url: str, portid: str) -> str:
+        """
+        Extract the API query URL with Playwright and store it in the cache
 
         Args:
             source_url: The page URL to load
@@ -174,44 +296,141 @@ class IMFPortWatchCollector:
         Returns:
             The captured API query URL
         """
-        captured_url = None
+        print(f"   📡 Extracting API URL from {source_url}...")
+
+        # Use Playwright to load the page and capture the query URL
+        query_url = self._extract_api_url(source_url, portid)
+
+        if not query_url:
+            raise Exception("Could not extract API URL from page")
 
-        def handle_request(request):
-            nonlocal captured_url
-            url = request.url
-            # Look for Daily_Chokepoints_Data query with the specific portid
-            if 'Daily_Chokepoints_Data' in url and '/query' in url and f"portid%3D%27{portid}%27" in url:
-                captured_url = url
+        print(f"   🎯 Found API URL")
+
+        self._store_cached_url(portid, query_url)
+        return query_url
+
+    def _load_url_cache(self) -> Dict[str, Any]:
+        """
+        Load the API URL cache from disk
+
+        Returns:
+            Dictionary of {portid: {"url": ..., "captured_at": ...}}
+        """
+        if not self.cache_path.exists():
+            return {}
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            with open(self.cache_path, 'rb') as f:
+                raw = f.read()
+            cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️ Ignoring unreadable URL cache: {e}")
+            return {}
 
-                # Listen for requests
-                page.on("request", handle_request)
+        if not isinstance(cache, dict):
+            print("   ⚠️ Ignoring malformed URL cache")
+            return {}
 
-                # Load page
-                page.goto(source_url, wait_until="load", timeout=30000)
+        return cache
 
-                # Wait for initial load
-                page.wait_for_timeout(10000)
+    def _get_cached_url(self, portid: str) -> str:
+        """
+        Get a cached API URL if it is within the TTL
 
-                # Scroll to trigger data loading
-                for i in range(20):
-                    page.keyboard.press("PageDown")
-                    page.wait_for_timeout(500)
+        Args:
+            portid: The chokepoint ID (e.g., 'chokepoint4')
 
-                    # Break early if we got the URL
-                    if captured_url:
-                        break
+        Returns:
+            Cached query URL, or None if missing, stale or unreadable
+        """
+        with self._cache_lock:
+            entry = self._url_cache.get(portid)
+
+        # Anything malformed (e.g. from an older or partial write) is a miss
+        try:
+            captured_at = datetime.fromisoformat(entry['captured_at'].rstrip('Z'))
+            url = entry['url']
+        except (TypeError, KeyError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(url, str) or not url:
+            return None
+
+        if datetime.utcnow() - captured_at > self.URL_CACHE_TTL:
+            return None
 
-                # Extra wait
-                page.wait_for_timeout(3000)
+        return url
 
-                browser.close()
+    def _store_cached_url(self, portid: str, url: str):
+        """
+        Store a discovered API URL and persist the cache
 
-                return captured_url
+        Args:
+            portid: The chokepoint ID (e.g., 'chokepoint4')
+            url: The captured API query URL
+        """
+        with self._cache_lock:
+            self._url_cache[portid] = {
+                'url': url,
+                'captured_at': datetime.utcnow().isoformat() + 'Z'
+            }
+
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix('.tmp')
+                if orjson is not None:
+                    payload = orjson.dumps(self._url_cache, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(self._url_cache, indent=2).encode('utf-8')
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                print(f"   ⚠️ Could not write URL cache: {e}")
+
+    def _extract_api_url(self, source_url: str, portid: str) -> str:
+        """
+        Extract the ArcGIS API query URL from the page by intercepting network requests
+
+        Args:
+            source_url: The page URL to load
+            portid: The chokepoint ID (e.g., 'chokepoint4')
+
+        Returns:
+            The captured API query URL
+        """
+        # Playwright is only needed when the URL isn't cached; import it on demand
+        from playwright.sync_api import TimeoutError as PlaywrightTimeout
+        from ._browser_pool import run_with_browser
+
+        # Look for Daily_Chokepoints_Data query with the specific portid
+        query_pattern = re.compile(rf"Daily_Chokepoints_Data.*?/query.*?portid%3D%27{re.escape(portid)}%27")
+
+        def is_query_request(request):
+            return query_pattern.search(request.url) is not None
+
+        def capture(browser):
+            context = browser.new_context()
+
+            try:
+                page = context.new_page()
+
+                # Load page and return as soon as the matching query fires
+                try:
+                    with page.expect_request(is_query_request, timeout=20000) as request_info:
+                        page.goto(source_url, wait_until="domcontentloaded", timeout=30000)
+                except PlaywrightTimeout:
+                    # Fall back to scrolling in case the chart only loads when in view
+                    with page.expect_request(is_query_request, timeout=10000) as request_info:
+                        page.keyboard.press("End")
+
+                return request_info.value.url
+
+            finally:
+                context.close()
+
+        try:
+            return run_with_browser(capture)
 
         except Exception as e:
             print(f"   ⚠️ Error extracting API URL: {e}")
@@ -2,9 +2,59 @@
 Backfill missing dates for data collection
 """
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List
+import os
+
+from .jsonio import read_json
+
+
+def _date_bitmaps(date_strs: Iterable[str]) -> Dict[int, int]:
+    """
+    Pack ISO date strings into one bitmap per year
+
+    Args:
+        date_strs: Date strings (YYYY-MM-DD); anything else is ignored
+
+    Returns:
+        Dictionary of {year: bitmap} where bit d is set for day d (0-based) of the year
+    """
+    bitmaps = {}
+
+    for date_str in date_strs:
+        try:
+            d = date.fromisoformat(date_str)
+        except ValueError:
+            continue
+
+        day_of_year = d.toordinal() - date(d.year, 1, 1).toordinal()
+        bitmaps[d.year] = bitmaps.get(d.year, 0) | (1 << day_of_year)
+
+    return bitmaps
+
+
+def _range_bitmaps(start: date, end: date) -> Dict[int, int]:
+    """
+    Build per-year bitmaps covering every date from start to end (inclusive)
+
+    Args:
+        start: First date
+        end: Last date
+
+    Returns:
+        Dictionary of {year: bitmap} in the same layout as _date_bitmaps
+    """
+    bitmaps = {}
+
+    for year in range(start.year, end.year + 1):
+        jan_1 = date(year, 1, 1).toordinal()
+        first = max(start, date(year, 1, 1)).toordinal() - jan_1
+        last = min(end, date(year, 12, 31)).toordinal() - jan_1
+        if first <= last:
+            bitmaps[year] = ((1 << (last - first + 1)) - 1) << first
+
+    return bitmaps
 
 
 class BackfillManager:
@@ -45,25 +95,29 @@ class BackfillManager:
 
         end = datetime.utcnow()
 
-        # Generate all dates in range
-        all_dates = []
-        current = start
-        while current <= end:
-            all_dates.append(current.strftime('%Y-%m-%d'))
-            current += timedelta(days=1)
+        # Bitmap per year of the dates we want (bit d = day d of the year)
+        wanted = _range_bitmaps(start.date(), end.date())
 
-        # Check which dates are missing
-        missing_dates = []
+        # Bitmap per year of the dates we have
+        have = {}
+        if data_dir.exists():
+            # Check which dates exist from the daily pickle files themselves: the
+            # Parquet table can fall behind them if an upsert fails
+            with os.scandir(data_dir) as it:
+                existing_files = [e.name[:-5] for e in it if e.name.endswith('.pckl')]
 
-        if not data_dir.exists():
-            # No data at all - all dates are missing
-            return all_dates
+            have = _date_bitmaps(existing_files)
 
-        existing_files = set(f.stem for f in data_dir.glob('*.pckl'))
+        # Missing = wanted & ~have, decoded lowest bit first so dates come out in order
+        missing_dates = []
+        for year in sorted(wanted):
+            bits = wanted[year] & ~have.get(year, 0)
+            jan_1 = date(year, 1, 1)
 
-        for date_str in all_dates:
-            if date_str not in existing_files:
-                missing_dates.append(date_str)
+            while bits:
+                lowest = bits & -bits
+                missing_dates.append((jan_1 + timedelta(days=lowest.bit_length() - 1)).isoformat())
+                bits ^= lowest
 
         return missing_dates
 
@@ -80,7 +134,8 @@ class BackfillManager:
         if not chokepoints_dir.exists():
             return missing_data
 
-        # Scan all chokepoint directories
+        # Scan all chokepoint directories (configs are tiny, read them serially)
+        tasks = []
         for chokepoint_dir in chokepoints_dir.iterdir():
             if not chokepoint_dir.is_dir():
                 continue
@@ -92,17 +147,31 @@ class BackfillManager:
             chokepoint_id = chokepoint_dir.name
 
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = read_json(config_file)
 
                 for variable_name in config.keys():
-                    missing = self.get_missing_dates(chokepoint_id, variable_name)
-                    if missing:
-                        missing_data[(chokepoint_id, variable_name)] = missing
+                    tasks.append((chokepoint_id, variable_name))
 
             except Exception as e:
                 print(f"❌ Error loading config for {chokepoint_id}: {e}")
 
+        if not tasks:
+            return missing_data
+
+        # Each (chokepoint, variable) scan is independent directory I/O
+        with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+            futures = [executor.submit(self.get_missing_dates, *task) for task in tasks]
+
+            for (chokepoint_id, variable_name), future in zip(tasks, futures):
+                try:
+                    missing = future.result()
+                except Exception as e:
+                    print(f"❌ Error checking {chokepoint_id}/{variable_name}: {e}")
+                    continue
+
+                if missing:
+                    missing_data[(chokepoint_id, variable_name)] = missing
+
         return missing_data
 
     def needs_backfill(self, chokepoint: str, variable: str) -> bool:
@@ -2,40 +2,75 @@
 Core Collector
 Reads JSON config and routes to appropriate collector
 """
-import json
+import atexit
+import os
 import pickle
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Tuple
 from urllib.parse import urlparse
 
-import sys
-from pathlib import Path
-# Add parent directory to path to allow imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Pick the import by how this package was imported, so that a real import
+# error inside the collector (e.g. a missing dependency) isn't masked
+if '.' in (__package__ or ''):
+    from ..collectors.imf_portwatch import IMFPortWatchCollector
+else:
+    # Imported as the top-level `core` package (src/ on sys.path)
+    from collectors.imf_portwatch import IMFPortWatchCollector
+from .jsonio import read_json, write_json
+
+try:
+    from . import storage
+except ImportError:
+    # pyarrow not installed; only the daily pickle files are written
+    storage = None
 
-from collectors.imf_portwatch import IMFPortWatchCollector
+# Project root (src/core -> two levels up), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 class DataCollector:
     """Main data collector that routes to specific collectors"""
 
-    def __init__(self, base_path: Path = None):
+    # Metadata writes are buffered per path and written once by flush_metadata()
+    _pending_metadata: Dict[Path, Dict[str, Any]] = {}
+    _metadata_lock = threading.Lock()
+
+    def __init__(self, base_path: Path = None, min_recheck_interval: timedelta = timedelta(hours=6)):
         """
         Initialize collector
 
         Args:
             base_path: Base path for the project (defaults to project root)
+            min_recheck_interval: Skip incremental collection if the variable was
+                last checked (successfully collected, with or without new data)
+                within this interval
         """
         if base_path is None:
-            # Assume we're in src/core, go up two levels
-            self.base_path = Path(__file__).parent.parent.parent
+            self.base_path = PROJECT_ROOT
         else:
             self.base_path = Path(base_path)
 
-        # Initialize collectors
+        # Roots for per-chokepoint data and config paths
+        self._chokepoints_root = self.base_path / 'data' / 'logistics' / 'chokepoints'
+        self._config_root = self.base_path / 'src' / 'logistics' / 'chokepoints'
+
+        self.min_recheck_interval = min_recheck_interval
+
+        # Parsed _metadata.json per (chokepoint, variable)
+        self._meta_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # Collector classes by domain, instantiated on first use
         self.collectors = {
-            'portwatch.imf.org': IMFPortWatchCollector(),
+            'portwatch.imf.org': IMFPortWatchCollector,
         }
+        self._collector_instances = {}
+        self._collector_lock = threading.Lock()
 
     def load_config(self, chokepoint: str) -> Dict[str, Any]:
         """
@@ -47,13 +82,26 @@ class DataCollector:
         Returns:
             Dictionary from state_variables.json
         """
-        config_path = self.base_path / 'src' / 'logistics' / 'chokepoints' / chokepoint / 'state_variables.json'
+        config_path = self._config_root / chokepoint / 'state_variables.json'
 
         if not config_path.exists():
             raise FileNotFoundError(f"Config not found: {config_path}")
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(config_path)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _domain_of(url: str) -> str:
+        """
+        Get the network location of a URL (cached)
+
+        Args:
+            url: Source URL
+
+        Returns:
+            Domain (netloc) of the URL
+        """
+        return urlparse(url).netloc
 
     def get_collector(self, source_url: str):
         """
@@ -65,17 +113,33 @@ class DataCollector:
         Returns:
             Collector instance
         """
-        parsed = urlparse(source_url)
-        domain = parsed.netloc
-
-        # Match domain to collector
-        for collector_domain, collector in self.collectors.items():
-            if collector_domain in domain:
-                return collector
-
-        raise ValueError(f"No collector found for domain: {domain}")
+        domain = self._domain_of(source_url)
 
-    def collect(self, chokepoint: str, variable: str, incremental: bool = True) -> Dict[str, Any]:
+        # Exact domain match first, then fall back to substring match
+        if domain in self.collectors:
+            collector_domain = domain
+        else:
+            collector_domain = next((d for d in self.collectors if d in domain), None)
+
+        if collector_domain is None:
+            raise ValueError(f"No collector found for domain: {domain}")
+
+        with self._collector_lock:
+            collector = self._collector_instances.get(collector_domain)
+            if collector is None:
+                collector = self.collectors[collector_domain]()
+                self._collector_instances[collector_domain] = collector
+
+        return collector
+
+    def collect(
+        self,
+        chokepoint: str,
+        variable: str,
+        incremental: bool = True,
+        throttle: Callable[[str], None] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
         """
         Collect data for a specific variable
 
@@ -83,6 +147,9 @@ class DataCollector:
             chokepoint: Chokepoint ID
             variable: Variable name
             incremental: If True, only fetch data from the last collected date onwards
+            throttle: Called with the source domain right before the remote fetch
+                (not called when collection is skipped)
+            force: Fetch even if the variable was checked within min_recheck_interval
 
         Returns:
             Collected data
@@ -105,7 +172,6 @@ class DataCollector:
             latest_date = self._get_latest_date(chokepoint, variable)
             if latest_date:
                 # Fetch from the day after the latest date
-                from datetime import datetime, timedelta
                 latest_dt = datetime.strptime(latest_date, '%Y-%m-%d')
                 next_day = latest_dt + timedelta(days=1)
                 start_date = next_day.strftime('%Y-%m-%d')
@@ -113,6 +179,23 @@ class DataCollector:
             else:
                 print(f"   📊 First time collection: fetching all historical data")
 
+            # The source publishes with a lag; don't ask again too soon after the last check
+            if start_date and not force and self._is_up_to_date(chokepoint, variable):
+                print(f"   ✅ Checked within the last {self.min_recheck_interval}, skipping collection")
+                return {
+                    "time_series": [],
+                    "total_records": 0,
+                    "timestamp": datetime.utcnow().isoformat() + "Z",
+                    "source": source_url,
+                    "chokepoint": chokepoint,
+                    "variable": variable,
+                    "status": "success",
+                    "note": "up-to-date"
+                }
+
+        if throttle is not None:
+            throttle(self._domain_of(source_url))
+
         # Collect data (pass start_date if collector supports it)
         try:
             data = collector.collect(source_url, chokepoint, variable, start_date=start_date)
@@ -123,8 +206,77 @@ class DataCollector:
         # Save to file
         self.save_data(chokepoint, variable, data)
 
+        # Collectors report failures as a status rather than raising; only a
+        # successful check may postpone the next one
+        if data.get('status') == 'success':
+            self._mark_checked(chokepoint, variable)
+
         return data
 
+    def collect_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        incremental: bool = True,
+        max_concurrency: int = 4,
+        per_domain_delay: Tuple[float, float] = (8, 15)
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Collect data for several variables concurrently
+
+        At most max_concurrency collections run at once, and consecutive
+        remote fetches from the same domain are started at least a random
+        per_domain_delay seconds apart to avoid tripping rate limits
+        (collections skipped as up to date don't wait).
+
+        Args:
+            pairs: List of (chokepoint, variable) tuples
+            incremental: If True, only fetch data from the last collected date onwards
+            max_concurrency: Maximum number of collections running at once
+            per_domain_delay: (min, max) seconds between request starts on one domain
+
+        Returns:
+            Dictionary of {(chokepoint, variable): collected data}
+        """
+        domain_locks = {}
+        last_start = {}
+        guard = threading.Lock()
+
+        def wait_turn(domain):
+            with guard:
+                lock = domain_locks.setdefault(domain, threading.Lock())
+
+            # Space out request starts per domain (politeness delay)
+            with lock:
+                if domain in last_start:
+                    wait = last_start[domain] + random.uniform(*per_domain_delay) - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                last_start[domain] = time.monotonic()
+
+        def run(pair):
+            chokepoint, variable = pair
+
+            try:
+                return self.collect(chokepoint, variable, incremental=incremental, throttle=wait_turn)
+
+            except Exception as e:
+                return {
+                    "chokepoint": chokepoint,
+                    "variable": variable,
+                    "status": "error",
+                    "error": str(e)
+                }
+
+        if not pairs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pairs)))) as executor:
+            results = list(executor.map(run, pairs))
+
+        self.flush_metadata()
+
+        return dict(zip(pairs, results))
+
     def save_data(self, chokepoint: str, variable: str, data: Dict[str, Any]):
         """
         Save collected data to pickle files with date-based naming
@@ -138,10 +290,9 @@ class DataCollector:
             variable: Variable name
             data: Data to save (may contain time_series field)
         """
-        from datetime import datetime
 
         # Create directory structure: data/logistics/chokepoints/{chokepoint}/{variable}/
-        data_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
+        data_dir = self._chokepoints_root / chokepoint / variable
         data_dir.mkdir(parents=True, exist_ok=True)
 
         # Check if data contains time series with actual data
@@ -152,6 +303,7 @@ class DataCollector:
 
             saved_count = 0
             skipped_count = 0
+            new_rows = []
 
             for daily_record in time_series:
                 date_str = daily_record['date']  # Already in YYYY-MM-DD format
@@ -180,11 +332,18 @@ class DataCollector:
                     'status': data['status']
                 }
 
+                # Serialize up front so each file is a single write
+                payload = pickle.dumps(daily_data, protocol=pickle.HIGHEST_PROTOCOL)
                 with open(file_path, 'wb') as f:
-                    pickle.dump(daily_data, f)
+                    f.write(payload)
 
+                new_rows.append(daily_data)
                 saved_count += 1
 
+            # Keep the per-variable columnar table in sync with the pickles
+            if storage is not None and new_rows:
+                self._update_table(data_dir, new_rows)
+
             # Update metadata
             if time_series:
                 latest_date = time_series[-1]['date']  # Already sorted by date
@@ -204,10 +363,33 @@ class DataCollector:
                 file_path = data_dir / f'{date_str}.pckl'
 
                 with open(file_path, 'wb') as f:
-                    pickle.dump(data, f)
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
                 print(f"   ⚠️  Saved non-timeseries data to: {file_path}")
 
+    def _update_table(self, data_dir: Path, new_records: list):
+        """
+        Upsert newly saved daily records into the variable's Parquet table
+
+        Migrates existing pickle files first if the table doesn't exist yet.
+
+        Args:
+            data_dir: Variable data directory
+            new_records: Daily data packages that were just saved
+        """
+        table_path = storage.table_path(data_dir)
+
+        try:
+            if not table_path.exists():
+                # migrate_pickles also picks up the files saved in this run
+                migrated = storage.migrate_pickles(data_dir)
+                print(f"   🗃️  Migrated {migrated} daily files to {table_path.name}")
+            else:
+                storage.upsert_rows(table_path, [storage.flatten_record(r) for r in new_records])
+
+        except Exception as e:
+            print(f"   ⚠️  Could not update {table_path.name}: {e}")
+
     def _update_metadata(self, chokepoint: str, variable: str, latest_date: str):
         """
         Update metadata file with the latest collected date
@@ -217,20 +399,91 @@ class DataCollector:
             variable: Variable name
             latest_date: Latest date in YYYY-MM-DD format
         """
-        from datetime import datetime
-
-        data_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
+        data_dir = self._chokepoints_root / chokepoint / variable
         metadata_path = data_dir / '_metadata.json'
 
+        now = datetime.utcnow().isoformat() + 'Z'
         metadata = {
             'chokepoint': chokepoint,
             'variable': variable,
             'latest_date': latest_date,
-            'last_updated': datetime.utcnow().isoformat() + 'Z'
+            'last_updated': now,
+            'last_checked': now
         }
 
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        with self._metadata_lock:
+            self._pending_metadata[metadata_path] = metadata
+            self._meta_cache[(chokepoint, variable)] = metadata
+
+    def _mark_checked(self, chokepoint: str, variable: str):
+        """
+        Record a successful collection in the metadata, even if it found no new data
+
+        Args:
+            chokepoint: Chokepoint ID
+            variable: Variable name
+        """
+        metadata = self._load_metadata(chokepoint, variable)
+
+        # Nothing collected yet, so there is nothing to skip next time either
+        if metadata is None:
+            return
+
+        metadata = {**metadata, 'last_checked': datetime.utcnow().isoformat() + 'Z'}
+        metadata_path = self._chokepoints_root / chokepoint / variable / '_metadata.json'
+
+        with self._metadata_lock:
+            self._pending_metadata[metadata_path] = metadata
+            self._meta_cache[(chokepoint, variable)] = metadata
+
+    @classmethod
+    def flush_metadata(cls):
+        """
+        Write all buffered metadata files to disk
+
+        Called after collect_many and at interpreter exit.
+        """
+        with cls._metadata_lock:
+            for metadata_path, metadata in cls._pending_metadata.items():
+                tmp_path = metadata_path.with_suffix('.json.tmp')
+                write_json(tmp_path, metadata)
+                os.replace(tmp_path, metadata_path)
+
+            cls._pending_metadata.clear()
+
+    def _load_metadata(self, chokepoint: str, variable: str) -> Dict[str, Any]:
+        """
+        Load the metadata file for a variable
+
+        Args:
+            chokepoint: Chokepoint ID
+            variable: Variable name
+
+        Returns:
+            Metadata dictionary, or None if no metadata
+        """
+        # In-memory copy, kept current by _update_metadata
+        with self._metadata_lock:
+            cached = self._meta_cache.get((chokepoint, variable))
+        if cached is not None:
+            return cached
+
+        data_dir = self._chokepoints_root / chokepoint / variable
+        metadata_path = data_dir / '_metadata.json'
+
+        # Prefer metadata that hasn't been flushed yet
+        with self._metadata_lock:
+            metadata = self._pending_metadata.get(metadata_path)
+
+        if metadata is None:
+            if not metadata_path.exists():
+                return None
+            metadata = read_json(metadata_path)
+
+        with self._metadata_lock:
+            self._meta_cache[(chokepoint, variable)] = metadata
+
+        return metadata
 
     def _get_latest_date(self, chokepoint: str, variable: str) -> str:
         """
@@ -243,17 +496,31 @@ class DataCollector:
         Returns:
             Latest date in YYYY-MM-DD format, or None if no metadata
         """
-        data_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
-        metadata_path = data_dir / '_metadata.json'
+        metadata = self._load_metadata(chokepoint, variable)
 
-        if not metadata_path.exists():
+        if metadata is None:
             return None
 
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-
         return metadata.get('latest_date')
 
+    def _is_up_to_date(self, chokepoint: str, variable: str) -> bool:
+        """
+        Check whether an incremental collection can be skipped
+
+        Args:
+            chokepoint: Chokepoint ID
+            variable: Variable name
+
+        Returns:
+            True if the variable was last checked within min_recheck_interval
+        """
+        metadata = self._load_metadata(chokepoint, variable)
+        if not metadata or not metadata.get('last_checked'):
+            return False
+
+        last_checked = datetime.fromisoformat(metadata['last_checked'].rstrip('Z'))
+        return datetime.utcnow() - last_checked < self.min_recheck_interval
+
     def load_data(self, chokepoint: str, variable: str, date: str = None) -> Dict[str, Any]:
         """
         Load saved data from pickle file
@@ -266,19 +533,23 @@ class DataCollector:
         Returns:
             Loaded data
         """
-        from datetime import datetime
 
-        data_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
+        data_dir = self._chokepoints_root / chokepoint / variable
 
         if not data_dir.exists():
             raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
         if date is None:
-            # Load latest file
-            files = sorted(data_dir.glob('*.pckl'), reverse=True)
-            if not files:
+            # Load latest file (ISO dates sort lexically, so a single max pass is enough)
+            with os.scandir(data_dir) as it:
+                latest = max(
+                    (e for e in it if e.name.endswith('.pckl') and not e.name.startswith('_')),
+                    key=lambda e: e.name,
+                    default=None
+                )
+            if latest is None:
                 raise FileNotFoundError(f"No data files found in: {data_dir}")
-            file_path = files[0]
+            file_path = Path(latest.path)
         else:
             file_path = data_dir / f'{date}.pckl'
             if not file_path.exists():
@@ -286,3 +557,6 @@ class DataCollector:
 
         with open(file_path, 'rb') as f:
             return pickle.load(f)
+
+
+atexit.register(DataCollector.flush_metadata)
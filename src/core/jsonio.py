@@ -0,0 +1,61 @@
+"""
+JSON file helpers
+Uses orjson when available, falling back to the stdlib json module
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a value as compact UTF-8 JSON
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_json(path: Path, obj: Any):
+    """
+    Write a value as indented (2 spaces) UTF-8 JSON
+
+    Args:
+        path: Path to the JSON file
+        obj: Value to serialize
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
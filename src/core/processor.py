@@ -2,13 +2,137 @@
 Data Processor
 Converts raw pickle data to CSV/JSON format with incremental processing
 """
-import json
-import csv
+import mmap
+import multiprocessing
+import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import pandas as pd
+
+from . import state
+from .jsonio import dumps, read_json, write_json
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from . import storage
+except ImportError:
+    # pyarrow not installed; raw data is only read from the pickle files
+    storage = None
+
+
+# Integer vessel count columns in the CSV output
+COUNT_COLUMNS = ['vessel_count', 'container', 'dry_bulk', 'general_cargo', 'roro', 'tanker']
+
+# CSV output columns, in order
+CSV_COLUMNS = ['date', *COUNT_COLUMNS, 'collected_at', 'chokepoint', 'variable']
+
+# Vessel type keys of the 'breakdown' dict in the raw data
+BREAKDOWN_KEYS = ['container', 'dry_bulk', 'general_cargo', 'roro', 'tanker']
+
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_LOAD_THRESHOLD = 500
+
+
+@lru_cache(maxsize=64)
+def _read_csv_dates(csv_path: str, mtime_ns: int, size: int) -> frozenset:
+    """
+    Read the date column of a processed CSV, cached per file version
+
+    Args:
+        csv_path: Path to CSV file
+        mtime_ns: File modification time (cache key only)
+        size: File size (cache key only)
+
+    Returns:
+        Frozen set of date strings
+    """
+    return frozenset(pd.read_csv(csv_path, usecols=['date'], dtype=str)['date'])
+
+
+def _list_pickles(raw_dir: Path) -> List[Path]:
+    """
+    List a variable's daily pickle files in one directory pass
+
+    Args:
+        raw_dir: Raw data directory for the variable
+
+    Returns:
+        {date}.pckl files sorted by name (i.e. by date), excluding '_' files
+    """
+    # scandir's entries carry the name and file type, so nothing is stat'ed
+    with os.scandir(raw_dir) as it:
+        names = sorted(
+            entry.name for entry in it
+            if entry.name.endswith('.pckl')
+            and not entry.name.startswith('_')
+            and entry.is_file(follow_symlinks=False)
+        )
+
+    return [raw_dir / name for name in names]
+
+
+def _load_one(pickle_path: Path, chokepoint: str = None, variable: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a single pickle file into a flat row
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        pickle_path: Path to a {date}.pckl file
+        chokepoint: Chokepoint ID (fallback when missing from the data)
+        variable: Variable name (fallback when missing from the data)
+
+    Returns:
+        Flat row dictionary in CSV column order, or None if the file isn't a daily record
+    """
+    # Load pickle file straight from a read-only mapping (no intermediate bytes copy)
+    with open(pickle_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = pickle.loads(mm)
+
+    # Skip if data doesn't have the expected structure
+    if not isinstance(data, dict) or 'date' not in data:
+        print(f"   ⚠️  Skipping {pickle_path.name}: invalid structure")
+        return None
+
+    # Convert to flat structure for CSV
+    breakdown = data.get('breakdown', {})
+    return {
+        'date': data.get('date', pickle_path.stem),
+        'vessel_count': data.get('vessel_count', 0),
+        'container': breakdown.get('container', 0),
+        'dry_bulk': breakdown.get('dry_bulk', 0),
+        'general_cargo': breakdown.get('general_cargo', 0),
+        'roro': breakdown.get('roro', 0),
+        'tanker': breakdown.get('tanker', 0),
+        'collected_at': data.get('collected_at', ''),
+        'chokepoint': data.get('chokepoint', chokepoint),
+        'variable': data.get('variable', variable)
+    }
+
+
+def _loader_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the multiprocessing context for the pickle loader pool
+
+    Forking a process that already runs other threads (APScheduler, the
+    browser thread, thread pools) can deadlock, so use forkserver where
+    available and spawn elsewhere.
+
+    Returns:
+        multiprocessing context
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
 
 class DataProcessor:
     """Process raw data into structured formats (CSV/JSON)"""
@@ -26,17 +150,20 @@ class DataProcessor:
         else:
             self.base_path = Path(base_path)
 
-    def process_to_csv(self, chokepoint: str, variable: str, incremental: bool = True) -> str:
+    def load_rows(self, chokepoint: str, variable: str, after_date: str = '') -> List[Dict[str, Any]]:
         """
-        Process pickle files to CSV format
+        Load a variable's raw data as flat rows
+
+        Pass the result to process_to_csv/process_to_json to produce several
+        outputs from one load.
 
         Args:
-            chokepoint: Chokepoint ID (e.g., 'bab-el-mandeb')
-            variable: Variable name (e.g., 'vessel_arrivals')
-            incremental: If True, only process new files since last run
+            chokepoint: Chokepoint ID
+            variable: Variable name
+            after_date: Only load dates after this one ('' loads everything)
 
         Returns:
-            Path to the generated CSV file
+            List of flat row dictionaries sorted by date
         """
         # Get raw data directory
         raw_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
@@ -44,145 +171,271 @@ class DataProcessor:
         if not raw_dir.exists():
             raise FileNotFoundError(f"Raw data directory not found: {raw_dir}")
 
-        # Create processed data directory
-        processed_dir = self.base_path / 'processed' / 'logistics' / 'chokepoints' / chokepoint / variable
-        processed_dir.mkdir(parents=True, exist_ok=True)
-
-        # CSV file path
-        csv_path = processed_dir / f'{variable}.csv'
-
         # Get list of pickle files to process
-        pickle_files = sorted(raw_dir.glob('*.pckl'))
+        pickle_files = _list_pickles(raw_dir)
 
         if not pickle_files:
             raise FileNotFoundError(f"No pickle files found in: {raw_dir}")
 
-        # If incremental, check which files have already been processed
-        processed_dates = set()
-        if incremental and csv_path.exists():
-            processed_dates = self._get_processed_dates_from_csv(csv_path)
-            print(f"   📊 Found {len(processed_dates)} existing records in CSV")
+        return self._read_raw(raw_dir, pickle_files, after_date, chokepoint, variable)
 
-        # Collect all data
-        all_data = []
-        new_count = 0
-
-        for pickle_file in pickle_files:
-            # Skip metadata file
-            if pickle_file.name.startswith('_'):
-                continue
-
-            date_str = pickle_file.stem  # e.g., '2026-01-25'
-
-            # Skip if already processed
-            if date_str in processed_dates:
-                continue
-
-            # Load pickle file
-            with open(pickle_file, 'rb') as f:
-                data = pickle.load(f)
-
-            # Skip if data doesn't have the expected structure
-            if not isinstance(data, dict) or 'date' not in data:
-                print(f"   ⚠️  Skipping {pickle_file.name}: invalid structure")
-                continue
-
-            # Convert to flat structure for CSV
-            row = {
-                'date': data.get('date', date_str),
-                'vessel_count': data.get('vessel_count', 0),
-                'container': data.get('breakdown', {}).get('container', 0),
-                'dry_bulk': data.get('breakdown', {}).get('dry_bulk', 0),
-                'general_cargo': data.get('breakdown', {}).get('general_cargo', 0),
-                'roro': data.get('breakdown', {}).get('roro', 0),
-                'tanker': data.get('breakdown', {}).get('tanker', 0),
-                'collected_at': data.get('collected_at', ''),
-                'chokepoint': data.get('chokepoint', chokepoint),
-                'variable': data.get('variable', variable)
-            }
+    def process_to_csv(
+        self,
+        chokepoint: str,
+        variable: str,
+        incremental: bool = True,
+        rows: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Process pickle files to CSV format
 
-            all_data.append(row)
-            new_count += 1
-
-        # If incremental and we have new data, append to existing CSV
-        if incremental and csv_path.exists() and new_count > 0:
-            print(f"   💾 Appending {new_count} new records to CSV...")
-
-            # Check if file ends with newline, add one if not
-            with open(csv_path, 'rb') as f:
-                f.seek(-1, 2)  # Go to last byte
-                last_char = f.read(1)
-                needs_newline = last_char != b'\n'
-
-            with open(csv_path, 'a', newline='', encoding='utf-8') as f:
-                # Add newline if the last line doesn't have one
-                if needs_newline:
-                    f.write('\n')
-
-                if all_data:
-                    writer = csv.DictWriter(f, fieldnames=all_data[0].keys())
-                    writer.writerows(all_data)
-
-        # Otherwise, write full CSV (including existing data)
-        elif all_data:
-            # If we're not in incremental mode or file doesn't exist, reload all data
-            if not incremental or not csv_path.exists():
-                print(f"   💾 Writing full CSV with {len(pickle_files)} records...")
-                all_data = []
-
-                for pickle_file in pickle_files:
-                    if pickle_file.name.startswith('_'):
-                        continue
-
-                    with open(pickle_file, 'rb') as f:
-                        data = pickle.load(f)
-
-                    row = {
-                        'date': data['date'],
-                        'vessel_count': data['vessel_count'],
-                        'container': data['breakdown']['container'],
-                        'dry_bulk': data['breakdown']['dry_bulk'],
-                        'general_cargo': data['breakdown']['general_cargo'],
-                        'roro': data['breakdown']['roro'],
-                        'tanker': data['breakdown']['tanker'],
-                        'collected_at': data['collected_at'],
-                        'chokepoint': data['chokepoint'],
-                        'variable': data['variable']
-                    }
-                    all_data.append(row)
+        Args:
+            chokepoint: Chokepoint ID (e.g., 'bab-el-mandeb')
+            variable: Variable name (e.g., 'vessel_arrivals')
+            incremental: If True, only process new files since last run
+            rows: All rows from load_rows, if already loaded (skips reading raw data)
+
+        Returns:
+            Path to the generated CSV file
+        """
+        processed_dir = self.base_path / 'processed' / 'logistics' / 'chokepoints' / chokepoint / variable
+
+        # CSV file path
+        csv_path = processed_dir / f'{variable}.csv'
 
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                if all_data:
-                    writer = csv.DictWriter(f, fieldnames=all_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(all_data)
+        # If incremental, only dates after the last processed one are new
+        # (ISO dates compare correctly as strings)
+        last_date = ''
+        if incremental and csv_path.exists():
+            last_date = self._load_state(processed_dir, csv_path)
+            print(f"   📊 Last processed date in CSV: {last_date or 'none'}")
 
-            print(f"   ✅ CSV written: {csv_path}")
+        # Collect all data (only rows newer than the CSV when appending)
+        if rows is None:
+            all_data = self.load_rows(chokepoint, variable, last_date)
         else:
+            all_data = [row for row in rows if row['date'] > last_date]
+
+        # Create processed data directory
+        processed_dir.mkdir(parents=True, exist_ok=True)
+
+        if not all_data:
             print(f"   ℹ️ No new data to process")
+        else:
+            # Append to an existing CSV when incremental, otherwise rewrite it
+            append = incremental and csv_path.exists()
+
+            if append:
+                print(f"   💾 Appending {len(all_data)} new records to CSV...")
+
+                # Keep the existing header's column order
+                columns = list(pd.read_csv(csv_path, nrows=0).columns)
+            else:
+                print(f"   💾 Writing full CSV with {len(all_data)} records...")
+                columns = CSV_COLUMNS
+
+            # Every row (header included) ends in '\r\n', so appends always start on a new line
+            # (1 MiB buffer so large writes go out in few syscalls; synced once at the end)
+            with open(csv_path, 'a' if append else 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                self._rows_to_frame(all_data).to_csv(
+                    f, header=not append, index=False, columns=columns, lineterminator='\r\n'
+                )
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._save_state(processed_dir, max(row['date'] for row in all_data))
+
+            if not append:
+                print(f"   ✅ CSV written: {csv_path}")
 
         # Update processing metadata
         self._update_processing_metadata(chokepoint, variable, 'csv', len(all_data))
 
         return str(csv_path)
 
-    def process_to_json(self, chokepoint: str, variable: str, format: str = 'records') -> str:
+    def process_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        incremental: bool = True,
+        max_workers: int = 4
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Process several variables to CSV concurrently
+
+        Each variable's raw data is loaded and written independently (large
+        directories still fan out to a process pool inside _load_rows).
+
+        Args:
+            pairs: List of (chokepoint, variable) tuples
+            incremental: If True, only process new files since last run
+            max_workers: Maximum number of variables processed at once
+
+        Returns:
+            Dictionary of {(chokepoint, variable): CSV path} for the variables that succeeded
+        """
+        csv_paths = {}
+
+        if not pairs:
+            return csv_paths
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+            futures = [
+                executor.submit(self.process_to_csv, chokepoint, variable, incremental)
+                for chokepoint, variable in pairs
+            ]
+
+            for pair, future in zip(pairs, futures):
+                try:
+                    csv_paths[pair] = future.result()
+                except Exception as e:
+                    print(f"   ❌ Error processing {pair[0]}/{pair[1]}: {e}")
+
+        return csv_paths
+
+    def _read_raw(
+        self,
+        raw_dir: Path,
+        pickle_files: List[Path],
+        after_date: str,
+        chokepoint: str,
+        variable: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Load raw rows, preferring the variable's Parquet table over the pickle files
+
+        The table is only used when it holds at least as many rows as there are
+        daily pickle files, i.e. it hasn't fallen behind the pickles.
+
+        Args:
+            raw_dir: Raw data directory for the variable
+            pickle_files: Sorted daily pickle files (from _list_pickles)
+            after_date: Only load dates after this one ('' loads everything)
+            chokepoint: Chokepoint ID (fallback when missing from the data)
+            variable: Variable name (fallback when missing from the data)
+
+        Returns:
+            List of flat row dictionaries in CSV column order
+        """
+        if storage is not None:
+            table_path = storage.table_path(raw_dir)
+            if table_path.exists():
+                table = storage.load_variable(table_path)
+
+                if table.num_rows >= len(pickle_files):
+                    return self._rows_from_table(table, after_date, chokepoint, variable)
+
+        return self._load_rows(pickle_files, after_date, chokepoint, variable)
+
+    def _rows_from_table(
+        self,
+        table: 'pa.Table',
+        after_date: str,
+        chokepoint: str,
+        variable: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert a variable's Parquet table into flat CSV rows
+
+        Args:
+            table: Table from storage.load_variable
+            after_date: Only return dates after this one ('' returns everything)
+            chokepoint: Chokepoint ID (fallback when missing from the data)
+            variable: Variable name (fallback when missing from the data)
+
+        Returns:
+            List of flat row dictionaries in CSV column order
+        """
+        # Filter in Arrow so only new rows become Python objects
+        if after_date:
+            table = table.filter(pc.greater(table.column('date'), after_date))
+
+        table = table.select(CSV_COLUMNS)
+
+        # Fill the fallbacks column-wise in Arrow rather than row by row in Python
+        for column, fallback in (('collected_at', ''), ('chokepoint', chokepoint), ('variable', variable)):
+            index = table.schema.get_field_index(column)
+            table = table.set_column(index, column, pc.fill_null(table.column(index), fallback))
+
+        return table.to_pylist()
+
+    def _load_rows(
+        self,
+        pickle_files: List[Path],
+        after_date: str,
+        chokepoint: str,
+        variable: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Load pickle files into flat CSV rows
+
+        Args:
+            pickle_files: Sorted daily pickle files (from _list_pickles)
+            after_date: Only load files whose date (stem) is after this one
+            chokepoint: Chokepoint ID (fallback when missing from the data)
+            variable: Variable name (fallback when missing from the data)
+
+        Returns:
+            List of flat row dictionaries in CSV column order
+        """
+        # Only hand workers files that still need loading
+        pending = [pickle_file for pickle_file in pickle_files if pickle_file.stem > after_date]
+
+        load = partial(_load_one, chokepoint=chokepoint, variable=variable)
+
+        if len(pending) >= PARALLEL_LOAD_THRESHOLD:
+            # Unpickling is CPU-bound; spread it across processes (map keeps order).
+            # Workers are started from a clean server process rather than forked,
+            # as this may run on a worker thread (process_many, the scheduler)
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(pending) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_loader_context()) as executor:
+                rows = list(executor.map(load, pending, chunksize=chunksize))
+        else:
+            rows = [load(pickle_file) for pickle_file in pending]
+
+        return [row for row in rows if row is not None]
+
+    def _rows_to_frame(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build a DataFrame from flat rows, keeping count columns as integers
+
+        Args:
+            rows: Flat row dictionaries from _load_rows
+
+        Returns:
+            DataFrame in CSV column order
+        """
+        df = pd.DataFrame.from_records(rows)
+
+        # Nullable ints so a missing count is written as '' rather than turning the column into floats
+        count_columns = [c for c in COUNT_COLUMNS if c in df.columns]
+        df[count_columns] = df[count_columns].astype('Int64')
+
+        return df
+
+    def process_to_json(
+        self,
+        chokepoint: str,
+        variable: str,
+        format: str = 'records',
+        rows: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """
         Process pickle files to JSON format
 
         Args:
             chokepoint: Chokepoint ID
             variable: Variable name
-            format: JSON format - 'records' (array of objects) or 'timeseries' (date->data mapping)
+            format: JSON format - 'records' (array of objects), 'timeseries' (date->data mapping)
+                or 'ndjson' (one flat row per line, with metadata in a .meta.json sidecar)
+            rows: All rows from load_rows, if already loaded (skips reading raw data)
 
         Returns:
             Path to the generated JSON file
         """
-        # Get raw data directory
-        raw_dir = self.base_path / 'data' / 'logistics' / 'chokepoints' / chokepoint / variable
-
-        if not raw_dir.exists():
-            raise FileNotFoundError(f"Raw data directory not found: {raw_dir}")
+        # Load all pickles once (in parallel for large directories)
+        if rows is None:
+            rows = self.load_rows(chokepoint, variable)
 
         # Create processed data directory
         processed_dir = self.base_path / 'processed' / 'logistics' / 'chokepoints' / chokepoint / variable
@@ -191,32 +444,43 @@ class DataProcessor:
         # JSON file path
         json_path = processed_dir / f'{variable}.json'
 
-        # Get list of pickle files
-        pickle_files = sorted(raw_dir.glob('*.pckl'))
-
-        if not pickle_files:
-            raise FileNotFoundError(f"No pickle files found in: {raw_dir}")
-
-        print(f"   💾 Processing {len(pickle_files)} files to JSON...")
+        print(f"   💾 Processing {len(rows)} records to JSON...")
 
         # Collect all data
-        if format == 'records':
-            # Array of objects format
-            all_data = []
-
-            for pickle_file in pickle_files:
-                if pickle_file.name.startswith('_'):
-                    continue
+        if format == 'ndjson':
+            # Columnar rows serialized by pandas, one object per line
+            json_path = processed_dir / f'{variable}.ndjson'
+            df = self._rows_to_frame(rows).reindex(columns=['date', *COUNT_COLUMNS, 'collected_at'])
+            df.to_json(
+                json_path, orient='records', lines=True, force_ascii=False
+            )
+
+            write_json(processed_dir / f'{variable}.meta.json', {
+                'chokepoint': chokepoint,
+                'variable': variable,
+                'total_records': len(df),
+                'date_range': {
+                    'start': rows[0]['date'] if rows else None,
+                    'end': rows[-1]['date'] if rows else None
+                },
+                'processed_at': datetime.utcnow().isoformat() + 'Z'
+            })
 
-                with open(pickle_file, 'rb') as f:
-                    data = pickle.load(f)
+            print(f"   ✅ NDJSON written: {json_path}")
+            self._update_processing_metadata(chokepoint, variable, 'json', len(rows))
+            return str(json_path)
 
-                all_data.append({
-                    'date': data['date'],
-                    'vessel_count': data['vessel_count'],
-                    'breakdown': data['breakdown'],
-                    'collected_at': data['collected_at']
-                })
+        if format == 'records':
+            # Array of objects format (built in one comprehension, sized up front)
+            all_data = [
+                {
+                    'date': row['date'],
+                    'vessel_count': row['vessel_count'],
+                    'breakdown': {key: row[key] for key in BREAKDOWN_KEYS},
+                    'collected_at': row['collected_at']
+                }
+                for row in rows
+            ]
 
             output = {
                 'chokepoint': chokepoint,
@@ -230,43 +494,45 @@ class DataProcessor:
                 'data': all_data
             }
 
-        else:  # timeseries format
-            # Date -> data mapping
-            timeseries = {}
+            # Write JSON
+            write_json(json_path, output)
 
-            for pickle_file in pickle_files:
-                if pickle_file.name.startswith('_'):
-                    continue
-
-                with open(pickle_file, 'rb') as f:
-                    data = pickle.load(f)
-
-                timeseries[data['date']] = {
-                    'vessel_count': data['vessel_count'],
-                    'breakdown': data['breakdown'],
-                    'collected_at': data['collected_at']
-                }
-
-            output = {
+        else:  # timeseries format
+            # Date -> data mapping, streamed one entry per line instead of
+            # building the whole mapping (and its serialized form) in memory
+            header = {
                 'chokepoint': chokepoint,
                 'variable': variable,
-                'total_records': len(timeseries),
-                'processed_at': datetime.utcnow().isoformat() + 'Z',
-                'timeseries': timeseries
+                'total_records': len({row['date'] for row in rows}),
+                'processed_at': datetime.utcnow().isoformat() + 'Z'
             }
 
-        # Write JSON
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+            with open(json_path, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n')
+                for key, value in header.items():
+                    f.write(b'  ' + dumps(key) + b': ' + dumps(value) + b',\n')
+
+                f.write(b'  "timeseries": {')
+                separator = b'\n'
+                for row in rows:
+                    entry = {
+                        'vessel_count': row['vessel_count'],
+                        'breakdown': {key: row[key] for key in BREAKDOWN_KEYS},
+                        'collected_at': row['collected_at']
+                    }
+                    f.write(separator + b'    ' + dumps(row['date']) + b': ' + dumps(entry))
+                    separator = b',\n'
+
+                f.write(b'\n  }\n}' if rows else b'}\n}')
 
         print(f"   ✅ JSON written: {json_path}")
 
         # Update processing metadata
-        self._update_processing_metadata(chokepoint, variable, 'json', len(pickle_files))
+        self._update_processing_metadata(chokepoint, variable, 'json', len(rows))
 
         return str(json_path)
 
-    def _get_processed_dates_from_csv(self, csv_path: Path) -> set:
+    def _get_processed_dates_from_csv(self, csv_path: Path) -> frozenset:
         """
         Read existing CSV and extract all dates that have been processed
 
@@ -274,16 +540,44 @@ class DataProcessor:
             csv_path: Path to CSV file
 
         Returns:
-            Set of date strings
+            Frozen set of date strings
+        """
+        # A rewritten or appended CSV changes mtime/size, which misses the cache
+        stat = os.stat(csv_path)
+        return _read_csv_dates(str(csv_path), stat.st_mtime_ns, stat.st_size)
+
+    def _load_state(self, processed_dir: Path, csv_path: Path) -> str:
+        """
+        Get the last processed date for a CSV
+
+        Falls back to the CSV's dates when no state has been saved yet.
+
+        Args:
+            processed_dir: Processed data directory
+            csv_path: Path to CSV file
+
+        Returns:
+            Last processed date (YYYY-MM-DD), or '' if nothing was processed
         """
-        dates = set()
+        state_path = processed_dir / '_processed_state.json'
+
+        if state_path.exists():
+            return read_json(state_path).get('last_date') or ''
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                dates.add(row['date'])
+        if csv_path.exists():
+            return max(self._get_processed_dates_from_csv(csv_path), default='')
 
-        return dates
+        return ''
+
+    def _save_state(self, processed_dir: Path, last_date: str):
+        """
+        Save the last processed date for a CSV
+
+        Args:
+            processed_dir: Processed data directory
+            last_date: Latest date written to the CSV (YYYY-MM-DD)
+        """
+        write_json(processed_dir / '_processed_state.json', {'last_date': last_date})
 
     def _update_processing_metadata(self, chokepoint: str, variable: str, format: str, record_count: int):
         """
@@ -295,22 +589,56 @@ class DataProcessor:
             format: Output format (csv/json)
             record_count: Number of records processed
         """
-        processed_dir = self.base_path / 'processed' / 'logistics' / 'chokepoints' / chokepoint / variable
-        metadata_path = processed_dir / f'_processing_metadata.json'
+        # Single-row UPSERT instead of rewriting a JSON file
+        state.upsert_processing_state(
+            self._state_db_path(), chokepoint, variable, format,
+            datetime.utcnow().isoformat() + 'Z', record_count
+        )
 
-        # Load existing metadata if it exists
-        if metadata_path.exists():
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-        else:
-            metadata = {}
+    def get_processing_metadata(self, chokepoint: str, variable: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata about processing
 
-        # Update metadata for this format
-        metadata[format] = {
-            'last_processed': datetime.utcnow().isoformat() + 'Z',
-            'record_count': record_count
-        }
+        Falls back to a legacy _processing_metadata.json when nothing is in the state database.
 
-        # Save metadata
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        Args:
+            chokepoint: Chokepoint ID
+            variable: Variable name
+
+        Returns:
+            Dictionary of {format: {'last_processed': ..., 'record_count': ...}}
+        """
+        metadata = state.load_processing_state(self._state_db_path(), chokepoint, variable)
+
+        if not metadata:
+            metadata_path = self._processing_metadata_path(chokepoint, variable)
+            if metadata_path.exists():
+                metadata = read_json(metadata_path)
+
+        return metadata
+
+    def export_processing_metadata(self, chokepoint: str, variable: str) -> str:
+        """
+        Write processing metadata to _processing_metadata.json (for older consumers)
+
+        Args:
+            chokepoint: Chokepoint ID
+            variable: Variable name
+
+        Returns:
+            Path to the generated JSON file
+        """
+        metadata_path = self._processing_metadata_path(chokepoint, variable)
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(metadata_path, self.get_processing_metadata(chokepoint, variable))
+
+        return str(metadata_path)
+
+    def _state_db_path(self) -> Path:
+        """Path to the processing state database"""
+        return self.base_path / 'processed' / 'state.db'
+
+    def _processing_metadata_path(self, chokepoint: str, variable: str) -> Path:
+        """Path to a variable's JSON processing metadata"""
+        processed_dir = self.base_path / 'processed' / 'logistics' / 'chokepoints' / chokepoint / variable
+        return processed_dir / '_processing_metadata.json'
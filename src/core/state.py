@@ -0,0 +1,108 @@
+"""
+Processing state store
+Keeps per-(chokepoint, variable, format) processing state in a small SQLite database
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processing_state (
+    chokepoint TEXT NOT NULL,
+    variable TEXT NOT NULL,
+    fmt TEXT NOT NULL,
+    last_processed TEXT,
+    record_count INTEGER,
+    PRIMARY KEY (chokepoint, variable, fmt)
+)
+"""
+
+# One connection per database file, shared by all threads (guarded by _lock)
+_connections: Dict[Path, sqlite3.Connection] = {}
+_lock = threading.Lock()
+
+
+def get_conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Get the connection for a state database, creating it on first use
+
+    Callers must hold _lock while using the connection.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        sqlite3 Connection in WAL mode with the schema created
+    """
+    db_path = Path(db_path)
+    conn = _connections.get(db_path)
+
+    if conn is None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit: each UPSERT is its own small transaction
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(SCHEMA)
+        _connections[db_path] = conn
+
+    return conn
+
+
+def upsert_processing_state(
+    db_path: Path,
+    chokepoint: str,
+    variable: str,
+    fmt: str,
+    last_processed: str,
+    record_count: int
+):
+    """
+    Insert or update the processing state of one output
+
+    Args:
+        db_path: Path to the SQLite database file
+        chokepoint: Chokepoint ID
+        variable: Variable name
+        fmt: Output format (csv/json)
+        last_processed: Processing timestamp (ISO format)
+        record_count: Number of records processed
+    """
+    with _lock:
+        get_conn(db_path).execute(
+            """
+            INSERT INTO processing_state (chokepoint, variable, fmt, last_processed, record_count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (chokepoint, variable, fmt) DO UPDATE SET
+                last_processed = excluded.last_processed,
+                record_count = excluded.record_count
+            """,
+            (chokepoint, variable, fmt, last_processed, record_count)
+        )
+
+
+def load_processing_state(db_path: Path, chokepoint: str, variable: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the processing state of every output of a variable
+
+    Args:
+        db_path: Path to the SQLite database file
+        chokepoint: Chokepoint ID
+        variable: Variable name
+
+    Returns:
+        Dictionary of {fmt: {'last_processed': ..., 'record_count': ...}}
+    """
+    with _lock:
+        rows = get_conn(db_path).execute(
+            'SELECT fmt, last_processed, record_count FROM processing_state WHERE chokepoint = ? AND variable = ?',
+            (chokepoint, variable)
+        ).fetchall()
+
+    return {
+        fmt: {'last_processed': last_processed, 'record_count': record_count}
+        for fmt, last_processed, record_count in rows
+    }
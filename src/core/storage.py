@@ -0,0 +1,147 @@
+"""
+Columnar storage for collected time series
+Keeps one Parquet table per variable (one row per date) next to the daily pickle files
+"""
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('vessel_count', pa.int64()),
+    ('container', pa.int64()),
+    ('dry_bulk', pa.int64()),
+    ('general_cargo', pa.int64()),
+    ('roro', pa.int64()),
+    ('tanker', pa.int64()),
+    ('collected_at', pa.string()),
+    ('source', pa.string()),
+    ('chokepoint', pa.string()),
+    ('variable', pa.string()),
+    ('status', pa.string()),
+])
+
+
+def table_path(data_dir: Path) -> Path:
+    """
+    Get the Parquet table path for a variable data directory
+
+    Args:
+        data_dir: data/logistics/chokepoints/{chokepoint}/{variable}
+
+    Returns:
+        data/logistics/chokepoints/{chokepoint}/{variable}.parquet
+    """
+    data_dir = Path(data_dir)
+    return data_dir.parent / f'{data_dir.name}.parquet'
+
+
+def flatten_record(daily_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a daily data package (as saved to pickle) into a table row
+
+    Args:
+        daily_data: Daily data dictionary with a nested 'breakdown'
+
+    Returns:
+        Flat row dictionary matching SCHEMA
+    """
+    breakdown = daily_data.get('breakdown', {})
+    return {
+        'date': daily_data['date'],
+        'vessel_count': daily_data.get('vessel_count', 0),
+        'container': breakdown.get('container', 0),
+        'dry_bulk': breakdown.get('dry_bulk', 0),
+        'general_cargo': breakdown.get('general_cargo', 0),
+        'roro': breakdown.get('roro', 0),
+        'tanker': breakdown.get('tanker', 0),
+        'collected_at': daily_data.get('collected_at'),
+        'source': daily_data.get('source'),
+        'chokepoint': daily_data.get('chokepoint'),
+        'variable': daily_data.get('variable'),
+        'status': daily_data.get('status'),
+    }
+
+
+def load_variable(path: Path) -> pa.Table:
+    """
+    Load a variable's table
+
+    Args:
+        path: Path to the Parquet table
+
+    Returns:
+        Table sorted by date (empty if the file doesn't exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return SCHEMA.empty_table()
+
+    return pq.read_table(path)
+
+
+def upsert_rows(path: Path, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert or replace rows (keyed on date) in a variable's table
+
+    Args:
+        path: Path to the Parquet table
+        rows: Flat row dictionaries matching SCHEMA
+
+    Returns:
+        Total number of rows in the table after the upsert
+    """
+    path = Path(path)
+    new_table = pa.Table.from_pylist(rows, schema=SCHEMA)
+
+    if path.exists():
+        existing = load_variable(path)
+        # Drop existing rows that the new batch replaces
+        keep = pc.invert(pc.is_in(existing.column('date'), value_set=new_table.column('date')))
+        new_table = pa.concat_tables([existing.filter(keep), new_table])
+
+    new_table = new_table.sort_by('date')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.parquet.tmp')
+    pq.write_table(new_table, tmp_path, compression='zstd')
+    tmp_path.replace(path)
+
+    return new_table.num_rows
+
+
+def migrate_pickles(data_dir: Path) -> int:
+    """
+    One-shot migration of a variable's daily pickle files into its table
+
+    Args:
+        data_dir: Variable data directory containing {date}.pckl files
+
+    Returns:
+        Number of rows migrated
+    """
+    data_dir = Path(data_dir)
+    rows = []
+
+    for pickle_file in sorted(data_dir.glob('*.pckl')):
+        if pickle_file.name.startswith('_'):
+            continue
+
+        with open(pickle_file, 'rb') as f:
+            data = pickle.load(f)
+
+        # Skip non-timeseries debug dumps
+        if not isinstance(data, dict) or 'date' not in data:
+            continue
+
+        rows.append(flatten_record(data))
+
+    if rows:
+        upsert_rows(table_path(data_dir), rows)
+
+    return len(rows)
@@ -14,6 +14,8 @@ def main():
     parser.add_argument('--chokepoint', required=True, help='Chokepoint ID (e.g., bab-el-mandeb)')
     parser.add_argument('--variable', required=True, help='Variable name (e.g., transit_status)')
     parser.add_argument('--show', action='store_true', help='Show collected data')
+    parser.add_argument('--force', action='store_true',
+                        help='Fetch even if the variable was checked recently (otherwise skipped for 6 hours after a successful check)')
 
     args = parser.parse_args()
 
@@ -22,7 +24,7 @@ def main():
     print(f"🔍 Collecting data for {args.chokepoint}/{args.variable}...")
 
     try:
-        data = collector.collect(args.chokepoint, args.variable)
+        data = collector.collect(args.chokepoint, args.variable, force=args.force)
 
         print(f"\n📊 Collection Result:")
         print(f"   Status: {data.get('status')}")
@@ -32,6 +34,9 @@ def main():
         if data.get('note'):
             print(f"   Note: {data.get('note')}")
 
+        if data.get('note') == 'up-to-date':
+            print(f"   💡 Skipped: checked within the last {collector.min_recheck_interval}; use --force to fetch anyway")
+
         if data.get('error'):
             print(f"   ❌ Error: {data.get('error')}")
 
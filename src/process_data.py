@@ -3,10 +3,153 @@ Data Processing Script
 Process raw pickle data to CSV/JSON format
 """
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
+
+from core.jsonio import read_json
 from core.processor import DataProcessor
 
 
+def process_pair(
+    processor: DataProcessor,
+    chokepoint: str,
+    variable: str,
+    fmt: str,
+    incremental: bool,
+    ndjson: bool,
+    export_metadata: bool = False
+):
+    """
+    Process one variable to the requested formats
+
+    Args:
+        processor: Data processor
+        chokepoint: Chokepoint ID
+        variable: Variable name
+        fmt: Output format ('csv', 'json' or 'both')
+        incremental: Only append new data to the CSV
+        ndjson: Write JSON as newline-delimited rows
+        export_metadata: Also write the legacy _processing_metadata.json
+    """
+    # JSON always needs every row, so load once and share them with the CSV
+    rows = None
+    if fmt == 'both':
+        rows = processor.load_rows(chokepoint, variable)
+
+    # Process to CSV
+    if fmt in ['csv', 'both']:
+        csv_path = processor.process_to_csv(
+            chokepoint,
+            variable,
+            incremental=incremental,
+            rows=rows
+        )
+        print(f'\n✅ CSV: {csv_path}')
+
+    # Process to JSON
+    if fmt in ['json', 'both']:
+        json_path = processor.process_to_json(
+            chokepoint,
+            variable,
+            format='ndjson' if ndjson else 'records',
+            rows=rows
+        )
+        print(f'\n✅ JSON: {json_path}')
+
+    # Processing state lives in processed/state.db; the JSON file is only
+    # generated for older consumers that still read it
+    if export_metadata:
+        metadata_path = processor.export_processing_metadata(chokepoint, variable)
+        print(f'\n✅ Metadata: {metadata_path}')
+
+
+def _process_pair_worker(
+    base_path: Path,
+    chokepoint: str,
+    variable: str,
+    fmt: str,
+    incremental: bool,
+    ndjson: bool,
+    export_metadata: bool
+) -> str:
+    """
+    Process one variable in a worker process
+
+    Returns:
+        Error message, or None on success
+    """
+    try:
+        process_pair(DataProcessor(base_path), chokepoint, variable, fmt, incremental, ndjson, export_metadata)
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def load_all_pairs(base_path: Path) -> List[Tuple[str, str]]:
+    """
+    Load every (chokepoint, variable) pair from the state_variables.json configs
+
+    Args:
+        base_path: Base path for the project
+
+    Returns:
+        List of (chokepoint, variable) tuples
+    """
+    pairs = []
+    chokepoints_dir = base_path / 'src' / 'logistics' / 'chokepoints'
+
+    for config_file in sorted(chokepoints_dir.glob('*/state_variables.json')):
+        for variable in read_json(config_file):
+            pairs.append((config_file.parent.name, variable))
+
+    return pairs
+
+
+def process_all(
+    processor: DataProcessor,
+    pairs: List[Tuple[str, str]],
+    fmt: str,
+    incremental: bool,
+    ndjson: bool,
+    export_metadata: bool = False
+) -> int:
+    """
+    Process every variable in one Python process, fanned out across CPU cores
+
+    Args:
+        processor: Data processor (its base_path is used by the workers)
+        pairs: List of (chokepoint, variable) tuples
+        fmt: Output format ('csv', 'json' or 'both')
+        incremental: Only append new data to the CSVs
+        ndjson: Write JSON as newline-delimited rows
+        export_metadata: Also write each legacy _processing_metadata.json
+
+    Returns:
+        Number of variables that failed
+    """
+    failed = 0
+    workers = max(1, min(os.cpu_count() or 1, len(pairs)))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _process_pair_worker, processor.base_path, chokepoint, variable,
+                fmt, incremental, ndjson, export_metadata
+            )
+            for chokepoint, variable in pairs
+        ]
+
+        for (chokepoint, variable), future in zip(pairs, futures):
+            error = future.result()
+            if error:
+                failed += 1
+                print(f'\n❌ {chokepoint}/{variable}: {error}')
+
+    return failed
+
+
 def main():
     parser = argparse.ArgumentParser(description='Process raw data to CSV/JSON')
 
@@ -32,6 +175,24 @@ def main():
         help='Output format (default: csv)'
     )
 
+    parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Write JSON as newline-delimited rows instead of one document (default: False)'
+    )
+
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Process every chokepoint/variable in state_variables.json (default: False)'
+    )
+
+    parser.add_argument(
+        '--export-metadata',
+        action='store_true',
+        help='Also write the legacy _processing_metadata.json from processed/state.db (default: False)'
+    )
+
     parser.add_argument(
         '--incremental',
         action='store_true',
@@ -48,31 +209,35 @@ def main():
 
     # Initialize processor
     processor = DataProcessor()
+    incremental = args.incremental and not args.full
+
+    if args.all:
+        pairs = load_all_pairs(processor.base_path)
+
+        print(f'📊 Processing {len(pairs)} variables')
+        print(f'   Format: {args.format}')
+        print(f'   Mode: {"Incremental" if incremental else "Full"}')
+        print()
+
+        failed = process_all(processor, pairs, args.format, incremental, args.ndjson, args.export_metadata)
+
+        if failed:
+            print(f'\n❌ {failed} of {len(pairs)} variables failed')
+            return 1
+
+        print('\n✅ Processing complete!')
+        return 0
 
     print(f'📊 Processing {args.chokepoint} / {args.variable}')
     print(f'   Format: {args.format}')
-    print(f'   Mode: {"Incremental" if args.incremental else "Full"}')
+    print(f'   Mode: {"Incremental" if incremental else "Full"}')
     print()
 
     try:
-        # Process to CSV
-        if args.format in ['csv', 'both']:
-            incremental = args.incremental and not args.full
-            csv_path = processor.process_to_csv(
-                args.chokepoint,
-                args.variable,
-                incremental=incremental
-            )
-            print(f'\n✅ CSV: {csv_path}')
-
-        # Process to JSON
-        if args.format in ['json', 'both']:
-            json_path = processor.process_to_json(
-                args.chokepoint,
-                args.variable,
-                format='records'
-            )
-            print(f'\n✅ JSON: {json_path}')
+        process_pair(
+            processor, args.chokepoint, args.variable, args.format,
+            incremental, args.ndjson, args.export_metadata
+        )
 
         print('\n✅ Processing complete!')
 
@@ -82,6 +247,5 @@ def main():
 
     return 0
 
-
 if __name__ == '__main__':
     exit(main())
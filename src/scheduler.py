@@ -2,25 +2,67 @@
 Daily Data Collection Scheduler
 Automatically collects data based on state_variables.json configurations
 """
-import json
 from pathlib import Path
 from datetime import datetime
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, List, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.collector import DataCollector
-from core.backfill import BackfillManager
-from core.processor import DataProcessor
+# APScheduler and the collector/processor stacks are imported on first use,
+# so e.g. --check doesn't pay for them at startup
+from core.jsonio import read_json
 from core.logger import setup_logger, setup_apscheduler_logging
 
+if TYPE_CHECKING:
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from core.backfill import BackfillManager
+    from core.collector import DataCollector
+    from core.processor import DataProcessor
+
 # Setup logging
 logger = setup_logger(__name__)
 setup_apscheduler_logging()
 
 
+# Cron fields for each update frequency, given the configured hour/minute
+_CRON_FIELDS = {
+    # Run every minute (for testing)
+    'test': lambda hour, minute: {'minute': '*'},
+    # Run every minute
+    'realtime': lambda hour, minute: {'minute': '*'},
+    # Run every 15 minutes
+    '15min': lambda hour, minute: {'minute': '*/15'},
+    # Run every hour at specified minute
+    'hourly': lambda hour, minute: {'minute': minute},
+    # Run daily at specified time
+    'daily': lambda hour, minute: {'hour': hour, 'minute': minute},
+    # Run weekly on Monday at specified time
+    'weekly': lambda hour, minute: {'day_of_week': 'mon', 'hour': hour, 'minute': minute},
+    # Run monthly on 1st at specified time
+    'monthly': lambda hour, minute: {'day': 1, 'hour': hour, 'minute': minute},
+}
+
+
+@lru_cache(maxsize=None)
+def _make_trigger(update_freq: str, hour: int, minute: int) -> 'CronTrigger':
+    """
+    Build the cron trigger for a schedule, shared by every job with the same one
+
+    Args:
+        update_freq: Update frequency (a key of _CRON_FIELDS)
+        hour: Hour of day (UTC)
+        minute: Minute of hour
+
+    Returns:
+        CronTrigger instance
+    """
+    from apscheduler.triggers.cron import CronTrigger
+    return CronTrigger(**_CRON_FIELDS[update_freq](hour, minute))
+
+
 class CollectionScheduler:
     """Scheduler for automated data collection"""
 
@@ -36,10 +78,39 @@ class CollectionScheduler:
         else:
             self.base_path = Path(base_path)
 
-        self.collector = DataCollector(self.base_path)
-        self.backfill_manager = BackfillManager(self.base_path)
-        self.processor = DataProcessor(self.base_path)
-        self.scheduler = BlockingScheduler()
+        # Created by schedule_all() / start()
+        self.scheduler = None
+
+    @cached_property
+    def collector(self) -> 'DataCollector':
+        """Data collector, created on first use"""
+        from core.collector import DataCollector
+        return DataCollector(self.base_path)
+
+    @cached_property
+    def backfill_manager(self) -> 'BackfillManager':
+        """Backfill manager, created on first use"""
+        from core.backfill import BackfillManager
+        return BackfillManager(self.base_path)
+
+    @cached_property
+    def processor(self) -> 'DataProcessor':
+        """Data processor, created on first use"""
+        from core.processor import DataProcessor
+        return DataProcessor(self.base_path)
+
+    def _get_scheduler(self) -> 'BlockingScheduler':
+        """
+        Get the APScheduler instance, creating it on first use
+
+        Returns:
+            BlockingScheduler instance
+        """
+        if self.scheduler is None:
+            from apscheduler.schedulers.blocking import BlockingScheduler
+            self.scheduler = BlockingScheduler()
+
+        return self.scheduler
 
     def load_all_configs(self):
         """
@@ -67,8 +138,7 @@ class CollectionScheduler:
             chokepoint_id = chokepoint_dir.name
 
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = read_json(config_file)
 
                 for variable_name, variable_config in config.items():
                     configs.append((chokepoint_id, variable_name, variable_config))
@@ -86,15 +156,30 @@ class CollectionScheduler:
             chokepoint: Chokepoint ID
             variable: Variable name
         """
+        self.collect_batch([(chokepoint, variable)])
+
+    def collect_batch(self, pairs: List[Tuple[str, str]]):
+        """
+        Collect data for several variables and process them to CSV in one batch
+
+        Args:
+            pairs: List of (chokepoint, variable) tuples
+        """
         try:
-            print(f"\n🔄 [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Collecting {chokepoint}/{variable}...")
-            data = self.collector.collect(chokepoint, variable)
-            print(f"   ✅ Collection success: {data.get('value')}")
+            print(f"\n🔄 [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Collecting {len(pairs)} variables...")
+            results = self.collector.collect_many(pairs)
+
+            collected = []
+            for (chokepoint, variable), data in results.items():
+                if data.get('status') == 'error':
+                    print(f"   ❌ {chokepoint}/{variable}: {data.get('error')}")
+                else:
+                    collected.append((chokepoint, variable))
 
-            # Process to CSV
-            print(f"   📊 Processing to CSV...")
-            csv_path = self.processor.process_to_csv(chokepoint, variable)
-            print(f"   ✅ CSV updated: {csv_path}")
+            # Process every collected variable to CSV in one batch
+            print(f"   📊 Processing {len(collected)} variables to CSV...")
+            for (chokepoint, variable), csv_path in self.processor.process_many(collected).items():
+                print(f"   ✅ CSV updated: {csv_path}")
 
         except Exception as e:
             print(f"   ❌ Error: {e}")
@@ -111,57 +196,54 @@ class CollectionScheduler:
 
         print(f"\n📅 Scheduling {len(configs)} collection tasks...")
 
-        for chokepoint, variable, config in configs:
-            update_freq = config.get('update_freq', 'daily')
-
-            # Get custom schedule time (optional)
-            schedule_hour = config.get('schedule_hour')
-            schedule_minute = config.get('schedule_minute', 0)
-
-            # Map update frequency to cron schedule
-            if update_freq == 'test':
-                # Run every minute (for testing)
-                trigger = CronTrigger(minute='*')
-            elif update_freq == 'realtime':
-                # Run every minute
-                trigger = CronTrigger(minute='*')
-            elif update_freq == '15min':
-                # Run every 15 minutes
-                trigger = CronTrigger(minute='*/15')
-            elif update_freq == 'hourly':
-                # Run every hour at specified minute
-                trigger = CronTrigger(minute=schedule_minute)
-            elif update_freq == 'daily':
-                # Run daily at specified time (default 00:00 UTC)
-                hour = schedule_hour if schedule_hour is not None else 0
-                trigger = CronTrigger(hour=hour, minute=schedule_minute)
-            elif update_freq == 'weekly':
-                # Run weekly on Monday at specified time
-                hour = schedule_hour if schedule_hour is not None else 0
-                trigger = CronTrigger(day_of_week='mon', hour=hour, minute=schedule_minute)
-            elif update_freq == 'monthly':
-                # Run monthly on 1st at specified time
-                hour = schedule_hour if schedule_hour is not None else 0
-                trigger = CronTrigger(day=1, hour=hour, minute=schedule_minute)
-            else:
-                print(f"   ⚠️  Unknown frequency '{update_freq}' for {chokepoint}/{variable}, defaulting to daily")
-                trigger = CronTrigger(hour=0, minute=0)
-
-            # Add job to scheduler
-            self.scheduler.add_job(
-                self.collect_data,
-                trigger=trigger,
-                args=[chokepoint, variable],
-                id=f"{chokepoint}_{variable}",
-                name=f"Collect {chokepoint}/{variable}",
-                replace_existing=True
-            )
-
-            # Show schedule time for daily/weekly/monthly
-            if update_freq in ['daily', 'weekly', 'monthly'] and schedule_hour is not None:
-                print(f"   ✓ Scheduled {chokepoint}/{variable} ({update_freq} at {schedule_hour:02d}:{schedule_minute:02d} UTC)")
-            else:
-                print(f"   ✓ Scheduled {chokepoint}/{variable} ({update_freq})")
+        scheduler = self._get_scheduler()
+
+        # Hold job processing while adding (only possible once the scheduler is running)
+        paused = scheduler.running
+        if paused:
+            scheduler.pause()
+
+        # Variables sharing a schedule are collected and processed by one job
+        batches = {}
+
+        try:
+            for chokepoint, variable, config in configs:
+                update_freq = config.get('update_freq', 'daily')
+
+                # Get custom schedule time (optional)
+                schedule_hour = config.get('schedule_hour')
+                schedule_minute = config.get('schedule_minute', 0)
+
+                # Map update frequency to cron schedule (default 00:00 UTC)
+                if update_freq not in _CRON_FIELDS:
+                    print(f"   ⚠️  Unknown frequency '{update_freq}' for {chokepoint}/{variable}, defaulting to daily")
+                    schedule = ('daily', 0, 0)
+                else:
+                    hour = schedule_hour if schedule_hour is not None else 0
+                    schedule = (update_freq, hour, schedule_minute)
+
+                batches.setdefault(schedule, []).append((chokepoint, variable))
+
+                # Show schedule time for daily/weekly/monthly
+                if update_freq in ['daily', 'weekly', 'monthly'] and schedule_hour is not None:
+                    print(f"   ✓ Scheduled {chokepoint}/{variable} ({update_freq} at {schedule_hour:02d}:{schedule_minute:02d} UTC)")
+                else:
+                    print(f"   ✓ Scheduled {chokepoint}/{variable} ({update_freq})")
+
+            # Add one job per schedule to scheduler
+            for (update_freq, hour, minute), pairs in batches.items():
+                scheduler.add_job(
+                    self.collect_batch,
+                    trigger=_make_trigger(update_freq, hour, minute),
+                    args=[pairs],
+                    id=f"collect_{update_freq}_{hour:02d}{minute:02d}",
+                    name=f"Collect {', '.join(f'{c}/{v}' for c, v in pairs)}",
+                    replace_existing=True
+                )
+
+        finally:
+            if paused:
+                scheduler.resume()
 
     def run_once_now(self):
         """
@@ -171,8 +253,8 @@ class CollectionScheduler:
 
         print(f"\n🚀 Running {len(configs)} collection tasks now...")
 
-        for chokepoint, variable, config in configs:
-            self.collect_data(chokepoint, variable)
+        pairs = [(chokepoint, variable) for chokepoint, variable, config in configs]
+        self.collect_batch(pairs)
 
     def check_and_backfill(self):
         """
@@ -211,13 +293,15 @@ class CollectionScheduler:
         print("="*60)
         print("\n📋 Scheduled jobs:")
 
-        for job in self.scheduler.get_jobs():
+        scheduler = self._get_scheduler()
+
+        for job in scheduler.get_jobs():
             print(f"   - {job.name}")
 
         print("\n⏸️  Press Ctrl+C to stop\n")
 
         try:
-            self.scheduler.start()
+            scheduler.start()
         except (KeyboardInterrupt, SystemExit):
             print("\n\n🛑 Scheduler stopped")
 
@@ -3,22 +3,28 @@ Visualization module for SeeSeaAgent
 """
 from .charts import (
     load_data,
+    load_data_parquet,
     plot_total_vessels_timeseries,
+    update_total_vessels,
     plot_vessel_type_breakdown,
     plot_vessel_type_percentage,
     plot_monthly_comparison,
     plot_weekly_pattern,
     plot_heatmap_monthly,
-    create_summary_stats
+    create_summary_stats,
+    render_all
 )
 
 __all__ = [
     'load_data',
+    'load_data_parquet',
     'plot_total_vessels_timeseries',
+    'update_total_vessels',
     'plot_vessel_type_breakdown',
     'plot_vessel_type_percentage',
     'plot_monthly_comparison',
     'plot_weekly_pattern',
     'plot_heatmap_monthly',
-    'create_summary_stats'
+    'create_summary_stats',
+    'render_all'
 ]
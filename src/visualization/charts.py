@@ -2,11 +2,22 @@
 Visualization Charts Module
 Provides various chart functions for vessel arrival data
 """
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import functools
+import hashlib
+import io
+import os
+import pickle
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 
 # Set style
@@ -14,28 +25,403 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (14, 6)
 plt.rcParams['font.size'] = 10
 
+# Let Agg drop sub-pixel segments of long series and draw them in chunks
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 
-def load_data(csv_path: str) -> pd.DataFrame:
+
+def _warm_up_fonts():
+    """
+    Draw a throwaway figure so font lookup and loading happen at import
+
+    Uses a standalone Agg canvas, so no pyplot window or figure is created.
+    """
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, '0', fontsize=plt.rcParams['font.size'], fontweight='bold')
+    fig.canvas.draw()
+
+
+_warm_up_fonts()
+
+
+# Vessel count columns, parsed straight to the smallest (nullable) integers
+# that hold them; per-type daily counts are far below the int16 range
+COUNT_DTYPES = {
+    'vessel_count': 'Int32',
+    'container': 'Int16',
+    'dry_bulk': 'Int16',
+    'general_cargo': 'Int16',
+    'roro': 'Int16',
+    'tanker': 'Int16'
+}
+
+
+class _Calendar(NamedTuple):
+    """Calendar fields of a DatetimeIndex as NumPy arrays"""
+    year: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    dayofweek: np.ndarray
+
+
+# id(index) -> (weak reference to the index, its calendar); entries drop when the index is freed
+_CALENDAR_CACHE: Dict[int, Tuple[weakref.ref, _Calendar]] = {}
+
+
+def _calendar(index: pd.DatetimeIndex) -> _Calendar:
+    """
+    Get the calendar fields of an index, computed once per index object
+
+    Charts rendered from the same DataFrame share the arrays.
+
+    Args:
+        index: DatetimeIndex of a vessel DataFrame
+
+    Returns:
+        _Calendar with year, month, day and dayofweek arrays
+    """
+    key = id(index)
+    entry = _CALENDAR_CACHE.get(key)
+    if entry is not None and entry[0]() is index:
+        return entry[1]
+
+    calendar = _Calendar(
+        year=index.year.to_numpy(),
+        month=index.month.to_numpy(),
+        day=index.day.to_numpy(),
+        dayofweek=index.dayofweek.to_numpy()
+    )
+    _CALENDAR_CACHE[key] = (weakref.ref(index, lambda _, key=key: _CALENDAR_CACHE.pop(key, None)), calendar)
+
+    return calendar
+
+
+def _date_rows(index: pd.DatetimeIndex, start: Optional[str], end: Optional[str]):
+    """
+    Select the rows of an index between two dates (inclusive)
+
+    On a sorted index (as from load_data) this is a label slice found by
+    binary search; otherwise it falls back to boolean masks.
+
+    Args:
+        index: DatetimeIndex of a vessel DataFrame
+        start: Start date or partial date (e.g. '2024', '2024-01-15'), None for open
+        end: End date or partial date, None for open
+
+    Returns:
+        Positional slice or boolean array usable with .iloc
+    """
+    if index.is_monotonic_increasing:
+        return index.slice_indexer(start, end)
+
+    mask = np.ones(len(index), dtype=bool)
+    if start:
+        mask &= index >= pd.Period(start).start_time
+    if end:
+        mask &= index <= pd.Period(end).end_time
+    return mask
+
+
+class _CountStats(NamedTuple):
+    """Reductions of a count column, missing values skipped"""
+    sum: int
+    mean: float
+    min: float
+    max: float
+    std: float
+
+
+def _count_stats(counts: pd.Series) -> _CountStats:
+    """
+    Sum, mean, min, max and sample std of an integer count column
+
+    Works on the int64 values directly: the sum and sum of squares are exact,
+    so the variance needs no float accumulation. Matches the pandas
+    reductions (skipna, std with ddof=1), with NaN where they give NA.
+
+    Args:
+        counts: Integer (nullable) Series of counts
+
+    Returns:
+        _CountStats of the column
+    """
+    values = counts.to_numpy(dtype=np.int64, na_value=0)
+    present = counts.notna().to_numpy()
+    n = int(present.sum())
+
+    total = int(values.sum())
+    if n == 0:
+        return _CountStats(total, np.nan, np.nan, np.nan, np.nan)
+
+    squares = int(np.dot(values, values))
+    std = np.sqrt((n * squares - total * total) / (n * (n - 1))) if n > 1 else np.nan
+
+    return _CountStats(
+        total,
+        total / n,
+        float(values.min(where=present, initial=np.iinfo(np.int64).max)),
+        float(values.max(where=present, initial=np.iinfo(np.int64).min)),
+        std
+    )
+
+
+def _centered_rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Centered rolling mean in one cumulative-sum pass
+
+    Matches Series.rolling(window, center=True).mean(): positions without a
+    full window, or whose window contains a NaN, are NaN.
+
+    Args:
+        values: 1-D float array (accumulated in float64)
+        window: Window length
+
+    Returns:
+        Array of rolling means, same length as values
+    """
+    out = np.full(values.shape, np.nan)
+    if values.size < window:
+        return out
+
+    # Window sum = difference of cumulative sums; track NaNs the same way
+    missing = np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values), dtype=np.float64)))
+    counts = np.concatenate(([0], np.cumsum(missing)))
+
+    means = (sums[window:] - sums[:-window]) / window
+    means[(counts[window:] - counts[:-window]) > 0] = np.nan
+
+    start = window // 2
+    out[start:start + means.size] = means
+    return out
+
+
+def _minmax_decimate(x: np.ndarray, y: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to the min and max of each of a number of equal buckets
+
+    Keeps the visual envelope of the line while drawing far fewer points.
+
+    Args:
+        x: X values (e.g. dates)
+        y: Float Y values (NaNs are ignored)
+        buckets: Number of buckets
+
+    Returns:
+        Tuple of (x, y) with two points per bucket: its min at the bucket start, its max at the bucket end
+    """
+    edges = np.unique(np.linspace(0, len(y), buckets + 1).astype(np.intp))
+    starts, ends = edges[:-1], edges[1:] - 1
+
+    out_x = np.empty(2 * starts.size, dtype=x.dtype)
+    out_y = np.empty(2 * starts.size, dtype=y.dtype)
+    out_x[0::2], out_x[1::2] = x[starts], x[ends]
+    out_y[0::2] = np.fmin.reduceat(y, starts)
+    out_y[1::2] = np.fmax.reduceat(y, starts)
+
+    return out_x, out_y
+
+
+def load_data(csv_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Load vessel arrival data from CSV
 
+    The parsed data is cached in a Parquet file next to the CSV and reused
+    until the CSV is modified again.
+
     Args:
         csv_path: Path to CSV file
+        columns: Only load these columns besides date, e.g. a chart's
+            .columns (default: all)
+
+    Returns:
+        DataFrame with date as index
+    """
+    csv_path = Path(csv_path)
+    cache_path = csv_path.with_suffix('.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+        return load_data_parquet(cache_path, columns)
+
+    # Multithreaded Arrow parser, with dates and counts typed while parsing
+    # (collected_at stays text, as Arrow would otherwise infer timestamps)
+    df = pd.read_csv(
+        csv_path,
+        engine='pyarrow',
+        parse_dates=['date'],
+        dtype={**COUNT_DTYPES, 'collected_at': str}
+    )
+
+    # Keep date as a column so the cache round-trips through load_data_parquet
+    try:
+        df.to_parquet(cache_path, engine='pyarrow', compression='snappy', index=False)
+    except OSError as e:
+        print(f"⚠️ Could not write Parquet cache: {e}")
+
+    if columns is not None:
+        df = df[['date', *columns]]
+
+    return _index_by_date(df)
+
+
+def load_data_parquet(parquet_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load vessel arrival data from Parquet (no CSV parsing)
+
+    The file is memory-mapped and only the requested column chunks are
+    read, so repeated loads are served from the OS page cache.
+
+    Args:
+        parquet_path: Path to Parquet file with a 'date' column
+        columns: Only load these columns besides date, e.g. a chart's
+            .columns (default: all)
 
     Returns:
         DataFrame with date as index
     """
-    df = pd.read_csv(csv_path)
-    df['date'] = pd.to_datetime(df['date'])
+    if columns is not None:
+        columns = ['date', *columns]
+
+    df = pd.read_parquet(parquet_path, engine='pyarrow', columns=columns, memory_map=True)
+    return _index_by_date(df)
+
+
+def _index_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index a loaded DataFrame by its date column
+
+    Args:
+        df: DataFrame with a datetime 'date' column
+
+    Returns:
+        DataFrame with date as index, sorted
+    """
     df = df.set_index('date')
-    df = df.sort_index()
+
+    # The processor writes dates in order, so sorting is usually unnecessary
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
     return df
 
 
+def _data_digest(df: pd.DataFrame, columns: List[str], name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Hash a function call on the index and some columns of a DataFrame
+
+    Args:
+        df: DataFrame passed to the function
+        columns: DataFrame columns the function reads
+        name: Function name
+        args: Other positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex digest, equal only for the same data and arguments
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(name.encode())
+    digest.update(repr((args, sorted(kwargs.items()))).encode())
+    digest.update(df.index.asi8.tobytes())
+    digest.update(np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64, na_value=np.nan)).tobytes())
+    return digest.hexdigest()
+
+
+# Plotting data computed from a DataFrame, by hash of its input data and arguments, oldest first
+DATA_CACHE_SIZE = 16
+_DATA_CACHE: 'OrderedDict[str, object]' = OrderedDict()
+
+
+def _data_cache(columns: List[str]) -> Callable:
+    """
+    Cache the plotting data a chart computes from its DataFrame
+
+    Charts render from these (read-only) results, so redrawing unchanged
+    data with e.g. another figure size or title skips pandas entirely.
+
+    Args:
+        columns: DataFrame columns the computation reads
+
+    Returns:
+        Decorator for functions taking the DataFrame as first argument
+    """
+    def decorator(compute: Callable) -> Callable:
+        @functools.wraps(compute)
+        def wrapper(df: pd.DataFrame, *args, **kwargs):
+            key = _data_digest(df, columns, compute.__name__, args, kwargs)
+
+            if key in _DATA_CACHE:
+                _DATA_CACHE.move_to_end(key)
+                return _DATA_CACHE[key]
+
+            result = compute(df, *args, **kwargs)
+
+            _DATA_CACHE[key] = result
+            if len(_DATA_CACHE) > DATA_CACHE_SIZE:
+                _DATA_CACHE.popitem(last=False)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# Rendered figures (pickled) by hash of their input data and arguments, oldest first
+FIGURE_CACHE_SIZE = 32
+_FIGURE_CACHE: 'OrderedDict[str, bytes]' = OrderedDict()
+
+
+def _fig_cache(columns: List[str]) -> Callable:
+    """
+    Cache a chart function's figures keyed on its input data and arguments
+
+    A repeated call with unchanged data returns a fresh copy of the cached
+    figure instead of redrawing it; any change to the index, the listed
+    columns or the arguments renders anew.
+
+    The columns are also kept as the chart's .columns, so callers can
+    load just those (see load_data).
+
+    Args:
+        columns: DataFrame columns the chart reads
+
+    Returns:
+        Decorator for plot functions taking the DataFrame as first argument
+    """
+    def decorator(plot: Callable) -> Callable:
+        @functools.wraps(plot)
+        def wrapper(df: pd.DataFrame, *args, **kwargs) -> plt.Figure:
+            key = _data_digest(df, columns, plot.__name__, args, kwargs)
+
+            cached = _FIGURE_CACHE.get(key)
+            if cached is not None:
+                _FIGURE_CACHE.move_to_end(key)
+                # Unpickling gives the caller its own figure to modify
+                return pickle.loads(cached)
+
+            fig = plot(df, *args, **kwargs)
+
+            _FIGURE_CACHE[key] = pickle.dumps(fig)
+            if len(_FIGURE_CACHE) > FIGURE_CACHE_SIZE:
+                _FIGURE_CACHE.popitem(last=False)
+
+            return fig
+
+        wrapper.columns = columns
+        return wrapper
+
+    return decorator
+
+
+@_fig_cache(['vessel_count'])
 def plot_total_vessels_timeseries(
     df: pd.DataFrame,
     title: str = "Daily Vessel Arrivals - Bab el-Mandeb Strait",
-    figsize: Tuple[int, int] = (14, 6)
+    figsize: Tuple[int, int] = (14, 6),
+    decimate: bool = True
 ) -> plt.Figure:
     """
     Plot total vessel count over time
@@ -44,14 +430,26 @@ def plot_total_vessels_timeseries(
         df: DataFrame with vessel data
         title: Chart title
         figsize: Figure size (width, height)
+        decimate: Reduce long series to a min/max envelope of about 2 points per pixel
 
     Returns:
         matplotlib Figure object
     """
     fig, ax = plt.subplots(figsize=figsize)
 
-    ax.plot(df.index, df['vessel_count'], linewidth=1.5, color='#2E86AB', alpha=0.8)
-    ax.fill_between(df.index, df['vessel_count'], alpha=0.3, color='#2E86AB')
+    dates = df.index.to_numpy()
+    # float32 at the plot boundary: half the bytes of float64 through every draw
+    counts = df['vessel_count'].to_numpy(dtype=np.float32, na_value=np.nan)
+
+    # Only draw what can show up at this figure width
+    x, y = dates, counts
+    target = int(figsize[0] * fig.dpi * 2)
+    if decimate and len(counts) > target:
+        x, y = _minmax_decimate(dates, counts, target // 2)
+
+    # Data artists are tagged so update_total_vessels can find them again
+    ax.plot(x, y, linewidth=1.5, color='#2E86AB', alpha=0.8, gid='vessel_count')
+    ax.fill_between(x, y, alpha=0.3, color='#2E86AB', gid='vessel_count_fill')
 
     ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
     ax.set_xlabel('Date', fontsize=12)
@@ -59,9 +457,9 @@ def plot_total_vessels_timeseries(
     ax.grid(True, alpha=0.3)
 
     # Add rolling average
-    rolling_30 = df['vessel_count'].rolling(window=30, center=True).mean()
-    ax.plot(df.index, rolling_30, linewidth=2, color='#A23B72',
-            label='30-day Moving Average', linestyle='--')
+    rolling_30 = _centered_rolling_mean(counts, 30)
+    ax.plot(dates, rolling_30, linewidth=2, color='#A23B72',
+            label='30-day Moving Average', linestyle='--', gid='rolling_30')
 
     ax.legend(loc='upper left')
     plt.tight_layout()
@@ -69,6 +467,79 @@ def plot_total_vessels_timeseries(
     return fig
 
 
+# Figure background (everything but the data artists) saved for blitting, with
+# the axes bounds it was taken at, by figure
+_BLIT_BACKGROUNDS: 'weakref.WeakKeyDictionary[Figure, Tuple[object, tuple]]' = weakref.WeakKeyDictionary()
+
+
+def update_total_vessels(fig: plt.Figure, counts: np.ndarray) -> plt.Figure:
+    """
+    Redraw only the data of a plot_total_vessels_timeseries figure
+
+    The first update saves the figure without its data as a background;
+    later updates restore it and blit the new lines, skipping the axes,
+    ticks, grid and text. The background is redrawn only when the new
+    counts leave the current y limits or the axes were resized. The data
+    artists stay regular artists, so full redraws (resize, show(),
+    savefig) still include them.
+
+    Args:
+        fig: Figure from plot_total_vessels_timeseries
+        counts: New vessel counts, one per date of the figure
+
+    Returns:
+        The same figure, updated
+    """
+    ax = fig.axes[0]
+    artists = {artist.get_gid(): artist for artist in ax.get_children() if artist.get_gid()}
+    line, fill, rolling_line = artists['vessel_count'], artists['vessel_count_fill'], artists['rolling_30']
+
+    dates = rolling_line.get_xdata()
+    counts = np.asarray(counts, dtype=np.float32)
+
+    # Same decimation as when the figure was drawn
+    x, y = dates, counts
+    if len(line.get_xdata()) != len(dates):
+        x, y = _minmax_decimate(dates, counts, len(line.get_xdata()) // 2)
+
+    line.set_data(x, y)
+    rolling_line.set_ydata(_centered_rolling_mean(counts, 30))
+    if hasattr(fill, 'set_data'):
+        fill.set_data(x, y, 0)
+    else:
+        # matplotlib < 3.10 can't update a fill_between in place
+        fill.remove()
+        fill = ax.fill_between(x, y, alpha=0.3, color='#2E86AB', gid='vessel_count_fill')
+    data_artists = (fill, line, rolling_line)
+
+    background, bounds = _BLIT_BACKGROUNDS.get(fig, (None, None))
+    bottom, top = ax.get_ylim()
+    if (background is None or bounds != ax.bbox.bounds
+            or np.nanmax(y, initial=bottom) > top or np.nanmin(y, initial=top) < bottom):
+        ax.relim()
+        ax.autoscale_view()
+
+        # Draw everything except the (temporarily animated) data artists, and keep it
+        for artist in data_artists:
+            artist.set_animated(True)
+        try:
+            fig.canvas.draw()
+        finally:
+            for artist in data_artists:
+                artist.set_animated(False)
+
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+        _BLIT_BACKGROUNDS[fig] = (background, ax.bbox.bounds)
+
+    fig.canvas.restore_region(background)
+    for artist in data_artists:
+        ax.draw_artist(artist)
+    fig.canvas.blit(ax.bbox)
+
+    return fig
+
+
+@_fig_cache(['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro'])
 def plot_vessel_type_breakdown(
     df: pd.DataFrame,
     title: str = "Vessel Type Distribution Over Time",
@@ -91,9 +562,12 @@ def plot_vessel_type_breakdown(
     vessel_types = ['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro']
     colors = ['#F18F01', '#C73E1D', '#6A994E', '#2E86AB', '#BC4B51']
 
+    # One (types x dates) float32 block instead of a list of five Series
+    data = df[vessel_types].to_numpy(dtype=np.float32, na_value=np.nan).T
+
     ax.stackplot(
         df.index,
-        [df[vtype] for vtype in vessel_types],
+        data,
         labels=[vtype.replace('_', ' ').title() for vtype in vessel_types],
         colors=colors,
         alpha=0.8
@@ -109,6 +583,27 @@ def plot_vessel_type_breakdown(
     return fig
 
 
+@_data_cache(['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro'])
+def _type_totals(df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]) -> List[int]:
+    """
+    Total of each vessel type, as int64 sums, filtered by date range if provided
+
+    Args:
+        df: DataFrame with vessel data
+        start_date: Start date filter (YYYY-MM-DD), None for open
+        end_date: End date filter (YYYY-MM-DD), None for open
+
+    Returns:
+        Totals of container, tanker, dry_bulk, general_cargo and roro
+    """
+    rows = _date_rows(df.index, start_date, end_date)
+    return [
+        int(df[vtype].iloc[rows].to_numpy(dtype=np.int64, na_value=0).sum())
+        for vtype in ['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro']
+    ]
+
+
+@_fig_cache(['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro'])
 def plot_vessel_type_percentage(
     df: pd.DataFrame,
     start_date: Optional[str] = None,
@@ -129,22 +624,14 @@ def plot_vessel_type_percentage(
     Returns:
         matplotlib Figure object
     """
-    # Filter by date range if provided
-    if start_date:
-        df = df[df.index >= start_date]
-    if end_date:
-        df = df[df.index <= end_date]
-
-    # Calculate totals for each vessel type
     vessel_types = ['container', 'tanker', 'dry_bulk', 'general_cargo', 'roro']
-    totals = {vtype: df[vtype].sum() for vtype in vessel_types}
+    values = _type_totals(df, start_date, end_date)
 
     # Create pie chart
     fig, ax = plt.subplots(figsize=figsize)
 
     colors = ['#F18F01', '#C73E1D', '#6A994E', '#2E86AB', '#BC4B51']
     labels = [vtype.replace('_', ' ').title() for vtype in vessel_types]
-    values = [totals[vtype] for vtype in vessel_types]
 
     wedges, texts, autotexts = ax.pie(
         values,
@@ -171,6 +658,23 @@ def plot_vessel_type_percentage(
     return fig
 
 
+@_data_cache(['vessel_count'])
+def _monthly_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Month x year table of average vessels per day
+
+    Args:
+        df: DataFrame with vessel data
+
+    Returns:
+        DataFrame indexed by month with one column per year (NaN for months without data)
+    """
+    # A single groupby pass (no copy of df)
+    calendar = _calendar(df.index)
+    return df['vessel_count'].groupby([calendar.year, calendar.month]).mean().unstack(level=0)
+
+
+@_fig_cache(['vessel_count'])
 def plot_monthly_comparison(
     df: pd.DataFrame,
     years: Optional[list] = None,
@@ -189,14 +693,11 @@ def plot_monthly_comparison(
     Returns:
         matplotlib Figure object
     """
-    # Add month column
-    df_copy = df.copy()
-    df_copy['year'] = df_copy.index.year
-    df_copy['month'] = df_copy.index.month
+    table = _monthly_table(df)
 
     # Default to last 3 years if not specified
     if years is None:
-        available_years = sorted(df_copy['year'].unique())
+        available_years = sorted(table.columns)
         years = available_years[-3:] if len(available_years) >= 3 else available_years
 
     fig, ax = plt.subplots(figsize=figsize)
@@ -207,8 +708,8 @@ def plot_monthly_comparison(
     colors = plt.cm.Set2(range(len(years)))
 
     for i, year in enumerate(years):
-        year_data = df_copy[df_copy['year'] == year]
-        monthly_avg = year_data.groupby('month')['vessel_count'].mean()
+        # A year without data plots as an empty line
+        monthly_avg = table[year].dropna() if year in table.columns else table.iloc[:0, 0]
 
         ax.plot(
             monthly_avg.index,
@@ -232,6 +733,21 @@ def plot_monthly_comparison(
     return fig
 
 
+@_data_cache(['vessel_count'])
+def _weekly_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mean and std of vessels per day, by day of week
+
+    Args:
+        df: DataFrame with vessel data
+
+    Returns:
+        DataFrame indexed by day of week (0 = Monday) with mean and std columns
+    """
+    return df['vessel_count'].groupby(_calendar(df.index).dayofweek).agg(['mean', 'std'])
+
+
+@_fig_cache(['vessel_count'])
 def plot_weekly_pattern(
     df: pd.DataFrame,
     title: str = "Average Vessel Arrivals by Day of Week",
@@ -248,11 +764,7 @@ def plot_weekly_pattern(
     Returns:
         matplotlib Figure object
     """
-    df_copy = df.copy()
-    df_copy['day_of_week'] = df_copy.index.dayofweek
-
-    # Calculate average by day of week
-    weekly_avg = df_copy.groupby('day_of_week')['vessel_count'].agg(['mean', 'std'])
+    weekly_avg = _weekly_stats(df)
 
     fig, ax = plt.subplots(figsize=figsize)
 
@@ -290,6 +802,37 @@ def plot_weekly_pattern(
     return fig
 
 
+@_data_cache(['vessel_count'])
+def _day_month_matrix(df: pd.DataFrame, year: Optional[int]) -> Tuple[int, np.ndarray]:
+    """
+    Vessel counts of one year as a day x month matrix
+
+    Args:
+        df: DataFrame with vessel data
+        year: Year to take (None for the latest year)
+
+    Returns:
+        Tuple of (year, 31 x 12 float32 matrix), NaN where a month has no
+        such day or the day has no data
+    """
+    calendar = _calendar(df.index)
+
+    # Filter by year (only the one column needed, not a copy of df)
+    if year is None:
+        year = calendar.year.max()
+
+    in_year = _date_rows(df.index, str(year), str(year))
+
+    # Scatter each day's count straight into the matrix
+    matrix = np.full((31, 12), np.nan, dtype=np.float32)
+    matrix[calendar.day[in_year] - 1, calendar.month[in_year] - 1] = (
+        df['vessel_count'].iloc[in_year].to_numpy(dtype=np.float32, na_value=np.nan)
+    )
+
+    return year, matrix
+
+
+@_fig_cache(['vessel_count'])
 def plot_heatmap_monthly(
     df: pd.DataFrame,
     year: Optional[int] = None,
@@ -308,39 +851,27 @@ def plot_heatmap_monthly(
     Returns:
         matplotlib Figure object
     """
-    df_copy = df.copy()
-
-    # Filter by year
-    if year is None:
-        year = df_copy.index.year.max()
-
-    df_year = df_copy[df_copy.index.year == year]
-
-    # Create pivot table
-    df_year['month'] = df_year.index.month
-    df_year['day'] = df_year.index.day
-
-    pivot = df_year.pivot_table(
-        values='vessel_count',
-        index='day',
-        columns='month',
-        aggfunc='mean'
-    )
+    year, matrix = _day_month_matrix(df, year)
 
     fig, ax = plt.subplots(figsize=figsize)
 
-    sns.heatmap(
-        pivot,
-        cmap='YlOrRd',
-        annot=False,
-        fmt='.0f',
-        cbar_kws={'label': 'Vessels'},
-        ax=ax
-    )
+    # Draw the matrix as one QuadMesh (NaN cells left blank), day 1 at the top
+    mesh = ax.pcolormesh(np.arange(13), np.arange(32), matrix, cmap='YlOrRd')
+    cbar = fig.colorbar(mesh, ax=ax, label='Vessels')
+    cbar.outline.set_visible(False)
+    ax.invert_yaxis()
+    ax.grid(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
 
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
+    # Label cell centres
+    ax.set_xticks(np.arange(12) + 0.5)
+    ax.set_yticks(np.arange(31) + 0.5)
+    ax.set_yticklabels(range(1, 32))
+
     ax.set_title(f"{title} ({year})", fontsize=16, fontweight='bold', pad=20)
     ax.set_xlabel('Month', fontsize=12)
     ax.set_ylabel('Day of Month', fontsize=12)
@@ -360,6 +891,9 @@ def create_summary_stats(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with summary statistics
     """
+    # All vessel_count reductions from the exact integer moments
+    agg = _count_stats(df['vessel_count'])._asdict()
+
     stats = pd.DataFrame({
         'Metric': [
             'Total Days',
@@ -373,12 +907,80 @@ def create_summary_stats(df: pd.DataFrame) -> pd.DataFrame:
         'Value': [
             len(df),
             f"{df.index.min().strftime('%Y-%m-%d')} to {df.index.max().strftime('%Y-%m-%d')}",
-            f"{df['vessel_count'].sum():,}",
-            f"{df['vessel_count'].mean():.2f}",
-            f"{df['vessel_count'].max()}",
-            f"{df['vessel_count'].min()}",
-            f"{df['vessel_count'].std():.2f}"
+            f"{agg['sum']:,.0f}",
+            f"{agg['mean']:.2f}",
+            f"{agg['max']:.0f}",
+            f"{agg['min']:.0f}",
+            f"{agg['std']:.2f}"
         ]
     })
 
     return stats
+
+
+# Charts built by render_all, by output name
+CHARTS = {
+    'total_vessels_timeseries': plot_total_vessels_timeseries,
+    'vessel_type_breakdown': plot_vessel_type_breakdown,
+    'vessel_type_percentage': plot_vessel_type_percentage,
+    'monthly_comparison': plot_monthly_comparison,
+    'weekly_pattern': plot_weekly_pattern,
+    'heatmap_monthly': plot_heatmap_monthly
+}
+
+# DataFrame shared by the charts rendered in one render_all worker process
+_worker_df: Optional[pd.DataFrame] = None
+
+
+def _init_render_worker(df: pd.DataFrame):
+    """Keep the DataFrame sent once to a render_all worker process"""
+    global _worker_df
+    _worker_df = df
+
+
+def _render_png(name: str) -> bytes:
+    """
+    Render one chart of the worker's DataFrame to PNG
+
+    Args:
+        name: Chart name (a key of CHARTS)
+
+    Returns:
+        PNG bytes
+    """
+    fig = CHARTS[name](_worker_df)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    plt.close(fig)
+
+    return buffer.getvalue()
+
+
+def render_all(df: pd.DataFrame, outdir: Optional[str] = None, max_workers: Optional[int] = None) -> Dict[str, bytes]:
+    """
+    Render every chart to PNG, one chart per worker process
+
+    Args:
+        df: DataFrame with vessel data
+        outdir: Directory to also save each chart to as {name}.png (optional)
+        max_workers: Maximum worker processes (default: one per CPU, at most one per chart)
+
+    Returns:
+        Dictionary of {chart name: PNG bytes}
+    """
+    if max_workers is None:
+        max_workers = min(len(CHARTS), os.cpu_count() or 1)
+
+    # The DataFrame is pickled once per worker rather than once per chart
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker, initargs=(df,)) as executor:
+        futures = {name: executor.submit(_render_png, name) for name in CHARTS}
+        images = {name: future.result() for name, future in futures.items()}
+
+    if outdir is not None:
+        outdir = Path(outdir)
+        outdir.mkdir(parents=True, exist_ok=True)
+        for name, png in images.items():
+            (outdir / f'{name}.png').write_bytes(png)
+
+    return images